@@ -6,12 +6,23 @@ This script can be used to run all tests for the new abstract data layer.
 """
 
 import sys
-import subprocess
 import os
+import importlib.util
 
 
-def run_tests():
-    """Run all tests for the data provider system."""
+def _xdist_args():
+    """Return pytest-xdist arguments if the plugin is installed."""
+    if importlib.util.find_spec("xdist") is None:
+        return []
+    return ["-n", "auto", "--dist=worksteal"]
+
+
+def run_tests(fast=False):
+    """Run all tests for the data provider system.
+
+    Args:
+        fast: Skip tests marked ``integration`` for a quicker unit-only run.
+    """
     
     # Change to the project root directory
     project_root = os.path.dirname(os.path.abspath(__file__))
@@ -21,28 +32,29 @@ def run_tests():
     print("=" * 50)
     
     try:
-        # Run pytest with verbose output
-        result = subprocess.run([
-            sys.executable, "-m", "pytest", 
-            "tests/", 
-            "-v", 
-            "--tb=short"
-        ], check=True)
-        
-        print("\n" + "=" * 50)
-        print("All tests passed successfully! ✅")
-        return 0
-        
-    except subprocess.CalledProcessError as e:
-        print("\n" + "=" * 50)
-        print(f"Some tests failed! ❌ (exit code: {e.returncode})")
-        return e.returncode
-    
-    except FileNotFoundError:
+        import pytest
+    except ImportError:
         print("Error: pytest not found. Please install it with:")
-        print("pip install pytest")
+        print("pip install pytest pytest-xdist")
         return 1
-
+    
+    # Run pytest in-process with verbose output, in parallel when pytest-xdist is available
+    args = [
+        "tests/", 
+        *_xdist_args(),
+        "-v", 
+        "--tb=short"
+    ]
+    if fast:
+        args += ["-m", "not integration"]
+    returncode = int(pytest.main(args))
+    
+    print("\n" + "=" * 50)
+    if returncode == 0:
+        print("All tests passed successfully! ✅")
+    else:
+        print(f"Some tests failed! ❌ (exit code: {returncode})")
+    return returncode
 
 if __name__ == "__main__":
-    sys.exit(run_tests())
\ No newline at end of file
+    sys.exit(run_tests(fast="--fast" in sys.argv[1:]))
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Shared pytest fixtures for the tradingagents test suite.
+"""
+
+import sys
+import pathlib
+import pytest
+from unittest.mock import MagicMock
+
+
+# Make the project root importable once per test process
+_ROOT = str(pathlib.Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+
+@pytest.fixture(autouse=True)
+def clear_provider_response_cache():
+    """Keep cached provider responses from leaking between tests."""
+    from tradingagents.dataflows.providers.base import clear_response_cache
+
+    clear_response_cache()
+    yield
+    clear_response_cache()
+
+
+@pytest.fixture(scope="session")
+def provider_spec():
+    """Build a DataProvider-specced mock once per session."""
+    from tradingagents.dataflows.providers.base import DataProvider
+
+    provider = MagicMock(spec=DataProvider)
+    provider.get_news.return_value = {}
+    provider.get_insider_sentiment.return_value = {}
+    provider.get_insider_transactions.return_value = {}
+    return provider
+
+
+@pytest.fixture
+def mock_provider(provider_spec):
+    """Provide the shared provider mock with its call history cleared."""
+    provider_spec.reset_mock()
+    # Tests may override these, so restore the canned empty results
+    provider_spec.get_news.return_value = {}
+    provider_spec.get_insider_sentiment.return_value = {}
+    provider_spec.get_insider_transactions.return_value = {}
+    return provider_spec
@@ -0,0 +1,62 @@
+"""
+Tests for the dataflows configuration module.
+"""
+
+import pytest
+from tradingagents.dataflows import config
+from tradingagents.dataflows.providers.factory import DataProviderFactory
+from tradingagents.default_config import DEFAULT_CONFIG
+
+
+@pytest.fixture(autouse=True)
+def restore_config(monkeypatch):
+    """Put the module-level config state back after each test."""
+    for name in ("_config", "_owned", "DATA_DIR"):
+        monkeypatch.setattr(config, name, getattr(config, name))
+    DataProviderFactory.clear_cache()
+    yield
+    DataProviderFactory.clear_cache()
+
+
+@pytest.mark.unit
+class TestConfig:
+    """Test cases for get_config, set_config and get_config_version."""
+
+    def test_set_config_does_not_mutate_defaults(self):
+        """Test that set_config copies the defaults before applying overrides."""
+        defaults = dict(DEFAULT_CONFIG)
+
+        config.set_config({"data_dir": "/tmp/custom", "max_concurrency": 2})
+
+        assert dict(DEFAULT_CONFIG) == defaults
+        assert config.get_config()["data_dir"] == "/tmp/custom"
+        assert config.DATA_DIR == "/tmp/custom"
+
+    def test_get_config_is_read_only(self):
+        """Test that the returned view rejects writes but tracks later set_config calls."""
+        view = config.get_config()
+
+        with pytest.raises(TypeError):
+            view["data_dir"] = "/tmp/other"
+
+        config.set_config({"data_dir": "/tmp/other"})
+        assert config.get_config()["data_dir"] == "/tmp/other"
+
+    def test_version_increments_on_every_set_config(self):
+        """Test that each set_config call bumps the version, even with unchanged values."""
+        version = config.get_config_version()
+
+        config.set_config({"data_dir": "/tmp/a"})
+        config.set_config({"data_dir": "/tmp/a"})
+
+        assert config.get_config_version() == version + 2
+
+    def test_set_config_invalidates_factory_instances(self, tmp_path):
+        """Test that providers built before set_config are not reused after it."""
+        config.set_config({"data_provider": "finnhub", "data_dir": str(tmp_path)})
+        first = DataProviderFactory.get_provider()
+
+        assert DataProviderFactory.get_provider() is first
+
+        config.set_config({"max_concurrency": 4})
+        assert DataProviderFactory.get_provider() is not first
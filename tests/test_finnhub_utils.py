@@ -0,0 +1,134 @@
+"""
+Tests for the on-disk Finnhub data loader.
+"""
+
+import json
+import os
+import pytest
+from tradingagents.dataflows import finnhub_utils
+from tradingagents.dataflows.finnhub_utils import get_data_in_range
+
+
+SAMPLE = {
+    "2024-01-01": [{"headline": "New year"}],
+    "2024-01-02": [],
+    "2024-01-05": [{"headline": "Earnings"}],
+    "2024-02-01": [{"headline": "February"}],
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_parsed_files():
+    """Start every test with an empty parsed-file cache."""
+    finnhub_utils.clear_cache()
+    yield
+    finnhub_utils.clear_cache()
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Write the sample news file in the layout get_data_in_range expects."""
+    news_dir = tmp_path / "finnhub_data" / "news_data"
+    news_dir.mkdir(parents=True)
+    (news_dir / "AAPL_data_formatted.json").write_text(json.dumps(SAMPLE))
+    return str(tmp_path)
+
+
+@pytest.mark.unit
+class TestGetDataInRange:
+    """Test cases for get_data_in_range."""
+
+    def test_filters_to_date_range(self, data_dir):
+        """Test that only non-empty dates inside the range are returned."""
+        result = get_data_in_range("AAPL", "2024-01-01", "2024-01-31", "news_data", data_dir)
+        
+        assert result == {
+            "2024-01-01": [{"headline": "New year"}],
+            "2024-01-05": [{"headline": "Earnings"}],
+        }
+
+    @pytest.mark.parametrize("start_date,end_date,expected", [
+        ("2023-12-01", "2023-12-31", []),
+        ("2024-01-05", "2024-01-05", ["2024-01-05"]),
+        ("2024-01-02", "2024-03-01", ["2024-01-05", "2024-02-01"]),
+        ("2024-02-02", "2024-01-01", []),
+    ])
+    def test_range_edges(self, data_dir, start_date, end_date, expected):
+        """Test inclusive bounds, empty ranges and ranges outside the file."""
+        result = get_data_in_range("AAPL", start_date, end_date, "news_data", data_dir)
+        
+        assert list(result) == expected
+
+    @pytest.mark.parametrize("start_date,end_date", [
+        ("2024-01-01", "2024-01-31"),
+        ("2023-01-01", "2024-12-31"),
+    ], ids=["partial", "whole-file"])
+    def test_results_do_not_alias_the_parsed_file(self, data_dir, start_date, end_date):
+        """Test that changing one call's day lists does not leak into later reads."""
+        first = get_data_in_range("AAPL", start_date, end_date, "news_data", data_dir)
+        first["2024-01-01"].append({"headline": "poison"})
+        first["2024-01-05"].clear()
+        
+        second = get_data_in_range("AAPL", start_date, end_date, "news_data", data_dir)
+        
+        assert second["2024-01-01"] == [{"headline": "New year"}]
+        assert second["2024-01-05"] == [{"headline": "Earnings"}]
+
+    def test_large_file_is_streamed(self, data_dir, monkeypatch):
+        """Test that files over the streaming threshold are filtered while parsing."""
+        pytest.importorskip("ijson")
+        monkeypatch.setattr(finnhub_utils, "_STREAM_THRESHOLD", 0)
+        
+        result = get_data_in_range("AAPL", "2024-01-01", "2024-01-31", "news_data", data_dir)
+        
+        assert list(result) == ["2024-01-01", "2024-01-05"]
+        assert finnhub_utils._load_file.cache_info().currsize == 0
+
+    @pytest.mark.parametrize("start_date,end_date", [
+        ("2024-01-01", "2024-01-31"),
+        ("2024-01-03", "2024-02-15"),
+        ("2023-11-01", "2024-03-01"),
+    ])
+    def test_month_shards_match_monolithic_file(self, data_dir, start_date, end_date):
+        """Test that reads from month shards return what the monolithic file does."""
+        expected = get_data_in_range("AAPL", start_date, end_date, "news_data", data_dir)
+        
+        finnhub_utils.build_month_shards("AAPL", "news_data", data_dir)
+        shard_dir = os.path.join(data_dir, "finnhub_data", "news_data", "AAPL")
+        
+        assert sorted(os.listdir(shard_dir)) == ["2024-01.json", "2024-02.json"]
+        assert get_data_in_range("AAPL", start_date, end_date, "news_data", data_dir) == expected
+
+    def test_full_range_returns_a_copy(self, data_dir):
+        """Test that a range covering the whole file returns every dated entry as a fresh dict."""
+        first = get_data_in_range("AAPL", "2000-01-01", "2100-01-01", "news_data", data_dir)
+        first["2099-01-01"] = []
+        second = get_data_in_range("AAPL", "2000-01-01", "2100-01-01", "news_data", data_dir)
+        
+        assert list(second) == ["2024-01-01", "2024-01-05", "2024-02-01"]
+
+    def test_missing_file_raises(self, data_dir):
+        """Test that a ticker without data raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            get_data_in_range("MSFT", "2024-01-01", "2024-01-31", "news_data", data_dir)
+
+    def test_parsed_file_is_reused(self, data_dir):
+        """Test that repeated reads of an unchanged file parse it only once."""
+        get_data_in_range("AAPL", "2024-01-01", "2024-01-31", "news_data", data_dir)
+        get_data_in_range("AAPL", "2024-02-01", "2024-02-29", "news_data", data_dir)
+        
+        info = finnhub_utils._load_file.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_rewritten_file_is_parsed_again(self, data_dir):
+        """Test that a newer modification time bypasses the cached parse."""
+        get_data_in_range("AAPL", "2024-01-01", "2024-01-31", "news_data", data_dir)
+        
+        path = os.path.join(data_dir, "finnhub_data", "news_data", "AAPL_data_formatted.json")
+        with open(path, "w") as f:
+            json.dump({"2024-01-03": [{"headline": "Updated"}]}, f)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        result = get_data_in_range("AAPL", "2024-01-01", "2024-01-31", "news_data", data_dir)
+        assert result == {"2024-01-03": [{"headline": "Updated"}]}
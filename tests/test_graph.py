@@ -0,0 +1,213 @@
+"""
+Tests for the LLM client cache and batched reflection used by TradingAgentsGraph.
+
+The chat SDKs and httpx are replaced with recording fakes. The modules are
+loaded from their files so the tests do not need LangGraph installed.
+"""
+
+import importlib.util
+import pathlib
+import sys
+import threading
+import time
+import types
+import pytest
+from types import SimpleNamespace
+
+
+GRAPH_DIR = pathlib.Path(__file__).resolve().parent.parent / "tradingagents" / "graph"
+
+
+def _load(name):
+    """Load one tradingagents/graph module by path, outside the graph package."""
+    spec = importlib.util.spec_from_file_location(f"_{name}_under_test", GRAPH_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeChatModel:
+    """Stand-in chat model that records its constructor arguments."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+@pytest.fixture
+def llm_clients(monkeypatch):
+    """Load llm_clients with fake chat SDKs and a fake httpx."""
+    for module_name, class_name in (
+        ("langchain_openai", "ChatOpenAI"),
+        ("langchain_anthropic", "ChatAnthropic"),
+        ("langchain_google_genai", "ChatGoogleGenerativeAI"),
+    ):
+        module = types.ModuleType(module_name)
+        setattr(module, class_name, type(class_name, (FakeChatModel,), {}))
+        monkeypatch.setitem(sys.modules, module_name, module)
+
+    httpx = types.ModuleType("httpx")
+    httpx.Limits = lambda **kwargs: kwargs
+    httpx.Client = lambda **kwargs: SimpleNamespace(close=lambda: None, **kwargs)
+    monkeypatch.setitem(sys.modules, "httpx", httpx)
+
+    module = _load("llm_clients")
+    monkeypatch.setattr(module.atexit, "register", lambda func: None)
+    return module
+
+
+@pytest.mark.unit
+class TestGetLlm:
+    """Test cases for _get_llm and clear_llm_cache."""
+
+    def test_same_key_reuses_client(self, llm_clients):
+        """Test that repeated lookups for one (provider, model, backend_url) share a client."""
+        first = llm_clients._get_llm("openai", "gpt-4o-mini", "https://api.openai.com/v1")
+
+        assert llm_clients._get_llm("openai", "gpt-4o-mini", "https://api.openai.com/v1") is first
+        assert first.kwargs["model"] == "gpt-4o-mini"
+        assert first.kwargs["base_url"] == "https://api.openai.com/v1"
+
+    @pytest.mark.parametrize("other", [
+        ("openai", "o4-mini", "https://api.openai.com/v1"),
+        ("openai", "gpt-4o-mini", "http://localhost:11434/v1"),
+        ("ollama", "gpt-4o-mini", "https://api.openai.com/v1"),
+    ], ids=["model", "backend_url", "provider"])
+    def test_each_key_part_gets_its_own_client(self, llm_clients, other):
+        """Test that changing any part of the key builds a new client."""
+        first = llm_clients._get_llm("openai", "gpt-4o-mini", "https://api.openai.com/v1")
+
+        assert llm_clients._get_llm(*other) is not first
+        assert len(llm_clients._llm_cache) == 2
+
+    def test_provider_name_is_case_insensitive(self, llm_clients):
+        """Test that provider names are lowercased before lookup and dispatch."""
+        first = llm_clients._get_llm("OpenRouter", "model", "https://openrouter.ai/api/v1")
+
+        assert llm_clients._get_llm("openrouter", "model", "https://openrouter.ai/api/v1") is first
+        assert type(first).__name__ == "ChatOpenAI"
+
+    @pytest.mark.parametrize("provider,class_name", [
+        ("Anthropic", "ChatAnthropic"),
+        ("GOOGLE", "ChatGoogleGenerativeAI"),
+        ("ollama", "ChatOpenAI"),
+    ])
+    def test_provider_selects_sdk(self, llm_clients, provider, class_name):
+        """Test that each provider is served by its own SDK class."""
+        assert type(llm_clients._get_llm(provider, "model", "http://backend")).__name__ == class_name
+
+    def test_unknown_provider_raises(self, llm_clients):
+        """Test that an unsupported provider is rejected and nothing is cached."""
+        with pytest.raises(ValueError, match="Unsupported LLM provider"):
+            llm_clients._get_llm("unknown", "model", "http://backend")
+        assert llm_clients._llm_cache == {}
+
+    def test_clear_llm_cache_forces_rebuild(self, llm_clients):
+        """Test that clear_llm_cache drops every cached client."""
+        first = llm_clients._get_llm("openai", "gpt-4o-mini", "https://api.openai.com/v1")
+
+        llm_clients.clear_llm_cache()
+
+        assert llm_clients._get_llm("openai", "gpt-4o-mini", "https://api.openai.com/v1") is not first
+
+    def test_concurrent_misses_build_one_client(self, llm_clients, monkeypatch):
+        """Test that threads racing on a cold key build the client only once."""
+        built = []
+
+        class SlowChatOpenAI(FakeChatModel):
+            def __init__(self, **kwargs):
+                built.append(kwargs)
+                # Widen the window between the cache check and the store
+                time.sleep(0.02)
+                super().__init__(**kwargs)
+
+        monkeypatch.setattr(sys.modules["langchain_openai"], "ChatOpenAI", SlowChatOpenAI)
+        barrier = threading.Barrier(4, timeout=2)
+        results = []
+
+        def lookup():
+            barrier.wait()
+            results.append(llm_clients._get_llm("openai", "gpt-4o-mini", "https://api.openai.com/v1"))
+
+        threads = [threading.Thread(target=lookup) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(built) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_openai_compatible_clients_share_http_client(self, llm_clients):
+        """Test that every ChatOpenAI gets the same pooled httpx client."""
+        deep = llm_clients._get_llm("openai", "o4-mini", "https://api.openai.com/v1")
+        quick = llm_clients._get_llm("ollama", "llama3", "http://localhost:11434/v1")
+        other = llm_clients._get_llm("anthropic", "claude", "https://api.anthropic.com")
+
+        assert deep.kwargs["http_client"] is quick.kwargs["http_client"]
+        assert deep.kwargs["http_client"].limits["max_connections"] == 64
+        assert "http_client" not in other.kwargs
+
+
+class FakeMemory:
+    """Records the situations added to it."""
+
+    def __init__(self):
+        self.added = []
+
+    def add_situations(self, situations_and_advice):
+        self.added.extend(situations_and_advice)
+
+
+class FakeBatchLlm:
+    """Answers llm.batch by echoing each prompt's human message."""
+
+    def __init__(self):
+        self.batches = []
+
+    def batch(self, prompts):
+        self.batches.append(prompts)
+        return [SimpleNamespace(content=messages[-1][1]) for messages in prompts]
+
+
+@pytest.mark.unit
+class TestReflectAll:
+    """Test cases for Reflector.reflect_all."""
+
+    @pytest.fixture
+    def reflector(self):
+        """Build a Reflector around the echoing batch LLM."""
+        return _load("reflection").Reflector(FakeBatchLlm())
+
+    def test_one_batch_call_updates_each_memory(self, reflector):
+        """Test that the five reflections go out in one batch and land in the right memories."""
+        state = {
+            "market_report": "m",
+            "sentiment_report": "s",
+            "news_report": "n",
+            "fundamentals_report": "f",
+            "investment_debate_state": {"bull_history": "bull", "bear_history": "bear", "judge_decision": "judge"},
+            "trader_investment_plan": "trader",
+            "risk_debate_state": {"judge_decision": "risk"},
+        }
+        memories = {name: FakeMemory() for name in ("bull", "bear", "trader", "judge", "risk")}
+
+        reflector.reflect_all(
+            state,
+            0.05,
+            memories["bull"],
+            memories["bear"],
+            memories["trader"],
+            memories["judge"],
+            memories["risk"],
+        )
+
+        assert len(reflector.quick_thinking_llm.batches) == 1
+        assert len(reflector.quick_thinking_llm.batches[0]) == 5
+        situation = reflector._extract_current_situation(state)
+        for name, memory in memories.items():
+            assert len(memory.added) == 1
+            stored_situation, lesson = memory.added[0]
+            assert stored_situation == situation
+            # Each memory gets the reflection on its own component's report
+            assert f"Analysis/Decision: {name}\n" in lesson
+            assert "Returns: 0.05" in lesson
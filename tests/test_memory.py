@@ -0,0 +1,325 @@
+"""
+Tests for the embedding path of FinancialSituationMemory.
+
+chromadb and the OpenAI client are replaced with in-process fakes, so these
+tests exercise batching, deduplication and caching without network access.
+"""
+
+import asyncio
+import importlib.util
+import pathlib
+import sys
+import threading
+import types
+import pytest
+from types import SimpleNamespace
+
+
+MEMORY_PATH = pathlib.Path(__file__).resolve().parent.parent / "tradingagents" / "agents" / "utils" / "memory.py"
+
+OPENAI_URL = "https://api.openai.com/v1"
+OLLAMA_URL = "http://localhost:11434/v1"
+
+
+def _vector(text):
+    """Deterministic stand-in embedding, so results can be matched to their text."""
+    return [float(len(text)), float(ord(text[0]))]
+
+
+class FakeEmbeddings:
+    """Records embeddings.create calls and answers them like the OpenAI API."""
+
+    def __init__(self):
+        self.inputs = []
+        self.barrier = None
+
+    def create(self, model, input):
+        self.inputs.append(input)
+        if self.barrier is not None:
+            self.barrier.wait()
+        texts = [input] if isinstance(input, str) else input
+        data = [SimpleNamespace(index=i, embedding=_vector(text)) for i, text in enumerate(texts)]
+        # The API does not promise input order, so hand the items back reversed
+        return SimpleNamespace(data=data[::-1])
+
+
+class FakeAsyncEmbeddings(FakeEmbeddings):
+    """Async counterpart of FakeEmbeddings that tracks how many requests overlap."""
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, model, input):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        # Yield so the other gathered requests can start before this one finishes
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return FakeEmbeddings.create(self, model, input)
+
+
+class FakeCollection:
+    """Minimal chromadb collection that keeps whatever is added."""
+
+    def __init__(self):
+        self.added = []
+
+    def count(self):
+        return len(self.added)
+
+    def add(self, documents, metadatas, embeddings, ids):
+        self.added.extend(zip(ids, documents, metadatas, embeddings))
+
+
+@pytest.fixture
+def memory_module(monkeypatch):
+    """Load memory.py against a stub chromadb, without importing the agents package."""
+    chromadb = types.ModuleType("chromadb")
+    chromadb.Client = lambda settings: SimpleNamespace(create_collection=lambda name: FakeCollection())
+    chromadb_config = types.ModuleType("chromadb.config")
+    chromadb_config.Settings = lambda **kwargs: kwargs
+    chromadb.config = chromadb_config
+    monkeypatch.setitem(sys.modules, "chromadb", chromadb)
+    monkeypatch.setitem(sys.modules, "chromadb.config", chromadb_config)
+
+    spec = importlib.util.spec_from_file_location("_memory_under_test", MEMORY_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def make_memory(memory_module):
+    """Build memories whose OpenAI client is a FakeEmbeddings recorder."""
+    def make(backend_url=OPENAI_URL, **config):
+        embeddings = FakeEmbeddings()
+        memory_module._clients[backend_url] = SimpleNamespace(embeddings=embeddings)
+        memory_module._async_clients[backend_url] = SimpleNamespace(embeddings=FakeAsyncEmbeddings())
+        memory = memory_module.FinancialSituationMemory("test", {"backend_url": backend_url, **config})
+        return memory, embeddings
+    return make
+
+
+@pytest.mark.unit
+class TestBackendSelection:
+    """Test cases for backend classification and per-backend defaults."""
+
+    @pytest.mark.parametrize("backend_url,kind,model", [
+        (OPENAI_URL, "OPENAI", "text-embedding-3-small"),
+        (OLLAMA_URL, "OLLAMA", "nomic-embed-text"),
+        ("http://ollama.internal/v1", "OLLAMA", "nomic-embed-text"),
+        ("https://openrouter.ai/api/v1", "OTHER", "text-embedding-3-small"),
+    ])
+    def test_backend_kind_and_default_model(self, make_memory, memory_module, backend_url, kind, model):
+        """Test that the backend URL picks the backend kind and embedding model."""
+        memory, _ = make_memory(backend_url)
+
+        assert memory.backend_kind is memory_module.BackendKind[kind]
+        assert memory.embedding == model
+
+    def test_embedding_model_from_config(self, make_memory):
+        """Test that embedding_model in the config overrides the per-backend default."""
+        memory, _ = make_memory(OLLAMA_URL, embedding_model="mxbai-embed-large")
+
+        assert memory.embedding == "mxbai-embed-large"
+
+    @pytest.mark.parametrize("backend_url,batch_size,batch_input", [
+        (OPENAI_URL, 25, True),
+        ("https://dashscope.aliyuncs.com/compatible-mode/v1", 10, True),
+        ("https://us-central1-aiplatform.googleapis.com/vertex", 250, True),
+        (OLLAMA_URL, 10, False),
+    ])
+    def test_default_batch_size(self, make_memory, backend_url, batch_size, batch_input):
+        """Test the per-backend batch size and whether list input is used."""
+        memory, _ = make_memory(backend_url)
+
+        assert memory.batch_size == batch_size
+        assert memory.batch_input is batch_input
+
+    def test_batch_size_from_config(self, make_memory):
+        """Test that embedding_batch_size in the config overrides the backend default."""
+        memory, _ = make_memory(embedding_batch_size=3)
+
+        assert memory.batch_size == 3
+
+
+@pytest.mark.unit
+class TestGetEmbeddings:
+    """Test cases for get_embedding and get_embeddings."""
+
+    def test_requests_are_split_into_batches(self, make_memory):
+        """Test that texts go out batch_size per request and come back in input order."""
+        memory, embeddings = make_memory(embedding_batch_size=2)
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+        result = memory.get_embeddings(texts)
+
+        assert sorted(embeddings.inputs) == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+        assert result == [_vector(text) for text in texts]
+
+    def test_batches_are_sent_concurrently(self, make_memory):
+        """Test that several batches are in flight at once."""
+        memory, embeddings = make_memory(embedding_batch_size=1)
+        # Each request waits until all three are in flight; serial requests would time out
+        embeddings.barrier = threading.Barrier(3, timeout=2)
+
+        result = memory.get_embeddings(["a", "bb", "ccc"])
+
+        assert result == [_vector("a"), _vector("bb"), _vector("ccc")]
+
+    def test_single_text_fallback_runs_in_parallel(self, make_memory):
+        """Test that backends without list input get concurrent single-text requests."""
+        memory, embeddings = make_memory(OLLAMA_URL)
+        embeddings.barrier = threading.Barrier(3, timeout=2)
+
+        result = memory.get_embeddings(["a", "bb", "ccc"])
+
+        assert sorted(embeddings.inputs) == ["a", "bb", "ccc"]
+        assert result == [_vector("a"), _vector("bb"), _vector("ccc")]
+
+    def test_duplicate_texts_are_requested_once(self, make_memory):
+        """Test that repeated texts in one call share a single embedding request."""
+        memory, embeddings = make_memory()
+
+        result = memory.get_embeddings(["a", "bb", "a"])
+
+        assert embeddings.inputs == [["a", "bb"]]
+        assert result == [_vector("a"), _vector("bb"), _vector("a")]
+
+    def test_get_embedding_returns_single_vector(self, make_memory):
+        """Test that get_embedding goes through the batched path for one text."""
+        memory, embeddings = make_memory()
+
+        assert memory.get_embedding("abc") == _vector("abc")
+        assert embeddings.inputs == [["abc"]]
+
+    def test_empty_input_makes_no_request(self, make_memory):
+        """Test that embedding nothing does not call the API."""
+        memory, embeddings = make_memory()
+
+        assert memory.get_embeddings([]) == []
+        assert embeddings.inputs == []
+
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    """Test cases for the per-memory embedding cache."""
+
+    def test_cached_texts_are_not_requested_again(self, make_memory):
+        """Test that only texts missing from the cache are requested."""
+        memory, embeddings = make_memory()
+
+        memory.get_embeddings(["a", "bb"])
+        result = memory.get_embeddings(["bb", "ccc", "a"])
+
+        assert embeddings.inputs == [["a", "bb"], ["ccc"]]
+        assert result == [_vector("bb"), _vector("ccc"), _vector("a")]
+
+    def test_cache_can_be_disabled(self, make_memory):
+        """Test that enable_embedding_cache=False sends every call to the API."""
+        memory, embeddings = make_memory(enable_embedding_cache=False)
+
+        memory.get_embedding("a")
+        memory.get_embedding("a")
+
+        assert embeddings.inputs == [["a"], ["a"]]
+
+    def test_clear_cache(self, make_memory):
+        """Test that clear_cache forces texts to be requested again."""
+        memory, embeddings = make_memory()
+
+        memory.get_embedding("a")
+        memory.clear_cache()
+        memory.get_embedding("a")
+
+        assert embeddings.inputs == [["a"], ["a"]]
+
+    def test_least_recently_used_entries_are_evicted(self, make_memory, memory_module, monkeypatch):
+        """Test that a full cache evicts the least recently used entry, not the oldest insert."""
+        monkeypatch.setattr(memory_module, "_CACHE_SIZE", 2)
+        memory, embeddings = make_memory()
+
+        memory.get_embedding("a")
+        memory.get_embedding("bb")
+        # Using "a" again makes "bb" the least recently used
+        memory.get_embedding("a")
+        memory.get_embedding("ccc")
+        memory.get_embeddings(["a", "bb"])
+
+        assert list(memory._cache) == [(memory.embedding, "a"), (memory.embedding, "bb")]
+        assert embeddings.inputs == [["a"], ["bb"], ["ccc"], ["bb"]]
+
+
+@pytest.mark.unit
+class TestAsyncAndStorage:
+    """Test cases for the async variants, client sharing and the chromadb round-trip."""
+
+    def test_async_variants_match_sync_results(self, make_memory):
+        """Test that aget_embedding and aget_embeddings return what the sync calls do."""
+        memory, embeddings = make_memory()
+
+        async def run():
+            return await asyncio.gather(memory.aget_embeddings(["a", "bb"]), memory.aget_embedding("ccc"))
+
+        many, one = asyncio.run(run())
+
+        assert many == [_vector("a"), _vector("bb")]
+        assert one == _vector("ccc")
+        # The async path goes through AsyncOpenAI, not the sync client
+        assert embeddings.inputs == []
+        assert sorted(memory.aclient.embeddings.inputs) == [["a", "bb"], ["ccc"]]
+
+    @pytest.mark.parametrize("backend_url,expected", [
+        (OPENAI_URL, [["a"], ["bb"], ["ccc"]]),
+        (OLLAMA_URL, ["a", "bb", "ccc"]),
+    ])
+    def test_async_requests_are_gathered(self, make_memory, backend_url, expected):
+        """Test that async batches, or single texts for non-batching backends, overlap on one loop."""
+        memory, _ = make_memory(backend_url, embedding_batch_size=1)
+
+        result = asyncio.run(memory.aget_embeddings(["a", "bb", "ccc"]))
+
+        assert result == [_vector("a"), _vector("bb"), _vector("ccc")]
+        assert memory.aclient.embeddings.inputs == expected
+        assert memory.aclient.embeddings.peak == 3
+
+    def test_async_path_shares_the_cache(self, make_memory):
+        """Test that texts embedded synchronously are served from the cache on the async path."""
+        memory, _ = make_memory()
+
+        memory.get_embedding("a")
+        result = asyncio.run(memory.aget_embeddings(["a", "bb"]))
+
+        assert result == [_vector("a"), _vector("bb")]
+        assert memory.aclient.embeddings.inputs == [["bb"]]
+
+    def test_memories_share_one_client_per_backend(self, memory_module, monkeypatch):
+        """Test that the OpenAI and AsyncOpenAI clients are each built once per backend URL."""
+        built = []
+        abuilt = []
+        monkeypatch.setattr("openai.OpenAI", lambda base_url: built.append(base_url) or SimpleNamespace())
+        monkeypatch.setattr("openai.AsyncOpenAI", lambda base_url: abuilt.append(base_url) or SimpleNamespace())
+        first = memory_module.FinancialSituationMemory("a", {"backend_url": OPENAI_URL})
+        second = memory_module.FinancialSituationMemory("b", {"backend_url": OPENAI_URL})
+        other = memory_module.FinancialSituationMemory("c", {"backend_url": OLLAMA_URL})
+
+        assert first.client is second.client
+        assert other.client is not first.client
+        assert built == [OPENAI_URL, OLLAMA_URL]
+        assert first.aclient is second.aclient
+        assert other.aclient is not first.aclient
+        assert abuilt == [OPENAI_URL, OLLAMA_URL]
+
+    def test_add_situations_stores_batched_embeddings(self, make_memory):
+        """Test that add_situations embeds every situation and stores it with its advice."""
+        memory, embeddings = make_memory()
+
+        memory.add_situations([("a", "buy"), ("bb", "sell")])
+
+        assert embeddings.inputs == [["a", "bb"]]
+        assert memory.situation_collection.added == [
+            ("0", "a", {"recommendation": "buy"}, _vector("a")),
+            ("1", "bb", {"recommendation": "sell"}, _vector("bb")),
+        ]
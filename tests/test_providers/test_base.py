@@ -2,17 +2,21 @@
 Tests for the DataProvider abstract base class.
 """
 
+import asyncio
+import json
+import threading
 import unittest
-import sys
-import os
+import pytest
+from unittest.mock import patch
 from abc import ABC
-
-# Add the project root to sys.path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
+from datetime import date
 from tradingagents.dataflows.providers.base import DataProvider
 
+# Unit tests must mock time; anything that really sleeps trips this
+pytestmark = pytest.mark.timeout(1)
+
 
+@pytest.mark.unit
 class TestDataProvider(unittest.TestCase):
     """Test cases for the DataProvider abstract base class."""
 
@@ -69,6 +73,314 @@ class TestDataProvider(unittest.TestCase):
         provider = MyCustomProvider("/tmp/data")
         self.assertEqual(provider.get_provider_name(), "mycustom")
 
+    def test_fetch_all_runs_methods_concurrently(self):
+        """Test that fetch_all gathers all three methods and overlaps their calls."""
+        # Each call waits until all three are in flight; sequential calls would time out
+        barrier = threading.Barrier(3, timeout=2)
+
+        class ConcurrentProvider(DataProvider):
+            def get_news(self, ticker, start_date, end_date):
+                barrier.wait()
+                return {"news": ticker}
+            
+            def get_insider_sentiment(self, ticker, start_date, end_date):
+                barrier.wait()
+                return {"sentiment": start_date}
+            
+            def get_insider_transactions(self, ticker, start_date, end_date):
+                barrier.wait()
+                return {"transactions": end_date}
+
+        provider = ConcurrentProvider("/tmp/data")
+        result = asyncio.run(provider.fetch_all("AAPL", "2024-01-01", "2024-01-07"))
+
+        self.assertEqual(result, (
+            {"news": "AAPL"},
+            {"sentiment": "2024-01-01"},
+            {"transactions": "2024-01-07"},
+        ))
+
+    def test_get_data_range_dispatches_requested_kinds(self):
+        """Test that get_data_range returns each requested kind and rejects unknown ones."""
+        provider = self._counting_provider()("/tmp/data")
+        
+        result = provider.get_data_range(
+            "AAPL", "2024-01-01", "2024-01-07", frozenset({"news", "insider_sentiment"})
+        )
+        
+        self.assertEqual(result, {
+            "news": {"2024-01-01": [{"headline": "AAPL"}]},
+            "insider_sentiment": {},
+        })
+        with self.assertRaises(ValueError):
+            provider.get_data_range("AAPL", "2024-01-01", "2024-01-07", frozenset({"filings"}))
+
+    def test_get_news_frame_flattens_articles(self):
+        """Test that get_news_frame returns one row per article with its date."""
+        provider = self._counting_provider()("/tmp/data")
+        
+        frame = provider.get_news_frame("AAPL", "2024-01-01", "2024-01-07")
+        
+        self.assertEqual(frame.to_dict("records"), [{"date": "2024-01-01", "headline": "AAPL"}])
+
+    def test_get_news_batch_defaults_to_per_ticker_calls(self):
+        """Test that the default batch fetch returns each ticker's news."""
+        provider = self._counting_provider()("/tmp/data")
+        
+        result = provider.get_news_batch(["AAPL", "MSFT"], "2024-01-01", "2024-01-07")
+        
+        self.assertEqual(result, {
+            "AAPL": {"2024-01-01": [{"headline": "AAPL"}]},
+            "MSFT": {"2024-01-01": [{"headline": "MSFT"}]},
+        })
+
+    def test_get_news_json_serializes_get_news(self):
+        """Test that the default JSON variant encodes the get_news result."""
+        provider = self._counting_provider()("/tmp/data")
+        
+        payload = provider.get_news_json("AAPL", "2024-01-01", "2024-01-07")
+        
+        self.assertIsInstance(payload, bytes)
+        self.assertEqual(json.loads(payload), {"2024-01-01": [{"headline": "AAPL"}]})
+
+    @patch('tradingagents.dataflows.providers.base.get_config', return_value={"max_concurrency": 2})
+    def test_aget_news_batch_limits_concurrency(self, mock_get_config):
+        """Test that the async batch fetch keeps at most max_concurrency calls in flight."""
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+        # Pairs of calls must overlap, so a serial fan-out would time out
+        barrier = threading.Barrier(2, timeout=2)
+
+        class TrackingProvider(DataProvider):
+            def get_news(self, ticker, start_date, end_date):
+                with lock:
+                    in_flight.append(ticker)
+                    peak.append(len(in_flight))
+                barrier.wait()
+                with lock:
+                    in_flight.remove(ticker)
+                return {start_date: [{"headline": ticker}]}
+            
+            def get_insider_sentiment(self, ticker, start_date, end_date):
+                return {}
+            
+            def get_insider_transactions(self, ticker, start_date, end_date):
+                return {}
+
+        tickers = ["AAPL", "MSFT", "GOOGL", "TSLA"]
+        result = asyncio.run(
+            TrackingProvider("/tmp/data").aget_news_batch(tickers, "2024-01-01", "2024-01-07")
+        )
+
+        self.assertEqual(list(result), tickers)
+        self.assertEqual(max(peak), 2)
+
+    def _counting_provider(self):
+        """Build a provider that counts how often get_news really runs."""
+        
+        class CountingProvider(DataProvider):
+            calls = 0
+            
+            def get_news(self, ticker, start_date, end_date):
+                CountingProvider.calls += 1
+                return {start_date: [{"headline": ticker}]}
+            
+            def get_insider_sentiment(self, ticker, start_date, end_date):
+                return {}
+            
+            def get_insider_transactions(self, ticker, start_date, end_date):
+                return {}
+
+        return CountingProvider
+
+    @patch('tradingagents.dataflows.providers.base.get_config', return_value={"provider_cache_ttl": 60})
+    def test_responses_are_cached(self, mock_get_config):
+        """Test that repeated calls with the same arguments reuse the cached response."""
+        provider_class = self._counting_provider()
+        
+        first = provider_class("/tmp/data").get_news("AAPL", "2024-01-01", "2024-01-07")
+        second = provider_class("/tmp/data").get_news("AAPL", "2024-01-01", "2024-01-07")
+        provider_class("/tmp/data").get_news("MSFT", "2024-01-01", "2024-01-07")
+        
+        self.assertEqual(first, second)
+        self.assertEqual(provider_class.calls, 2)
+
+    @patch('tradingagents.dataflows.providers.base.get_config', return_value={"provider_cache_ttl": 60})
+    def test_keyword_calls_share_the_positional_cache_entry(self, mock_get_config):
+        """Test that keyword arguments are accepted and keyed like the positional call."""
+        provider_class = self._counting_provider()
+        provider = provider_class("/tmp/data")
+        
+        first = provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        second = provider.get_news(ticker="AAPL", start_date="2024-01-01", end_date="2024-01-07")
+        
+        self.assertEqual(first, second)
+        self.assertEqual(provider_class.calls, 1)
+
+    @patch('tradingagents.dataflows.providers.base.get_config', return_value={"provider_cache_ttl": 60})
+    def test_cached_results_are_isolated_from_caller_mutation(self, mock_get_config):
+        """Test that mutating a returned result does not change later cached results."""
+        provider = self._counting_provider()("/tmp/data")
+        
+        first = provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        first["2024-01-01"].append("poison")
+        first["poison"] = 1
+        second = provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        second["2024-01-01"].clear()
+        
+        self.assertEqual(
+            provider.get_news("AAPL", "2024-01-01", "2024-01-07"),
+            {"2024-01-01": [{"headline": "AAPL"}]},
+        )
+
+    @patch('tradingagents.dataflows.providers.base._RESPONSE_CACHE_SIZE', 2)
+    @patch('tradingagents.dataflows.providers.base.get_config', return_value={"provider_cache_ttl": 60})
+    def test_response_cache_is_bounded(self, mock_get_config):
+        """Test that the least recently used response is evicted once the cache is full."""
+        from tradingagents.dataflows.providers import base
+        provider_class = self._counting_provider()
+        provider = provider_class("/tmp/data")
+        
+        for ticker in ("AAPL", "MSFT", "AAPL", "TSLA"):
+            provider.get_news(ticker, "2024-01-01", "2024-01-07")
+        self.assertEqual(len(base._response_cache), 2)
+        self.assertEqual(provider_class.calls, 3)
+        
+        # MSFT was least recently used, so it had to be fetched again
+        provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        provider.get_news("MSFT", "2024-01-01", "2024-01-07")
+        self.assertEqual(provider_class.calls, 4)
+
+    @patch('tradingagents.dataflows.providers.base.get_config', return_value={"provider_cache_ttl": 60})
+    def test_set_config_invalidates_cached_responses(self, mock_get_config):
+        """Test that responses cached under one config version are not served after set_config."""
+        provider_class = self._counting_provider()
+        provider = provider_class("/tmp/data")
+        
+        provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        with patch('tradingagents.dataflows.providers.base.get_config_version', return_value=-1):
+            provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        
+        self.assertEqual(provider_class.calls, 2)
+
+    @patch(
+        'tradingagents.dataflows.providers.base.get_config',
+        return_value={"provider_cache_ttl": 60, "provider_cache_recent_ttl": 5},
+    )
+    def test_ranges_reaching_today_expire_sooner(self, mock_get_config):
+        """Test that ranges ending today use the short TTL while historical ranges keep the long one."""
+        provider_class = self._counting_provider()
+        provider = provider_class("/tmp/data")
+        today = date.today().isoformat()
+        clock = [1000.0]
+        
+        with patch('tradingagents.dataflows.providers.base.time.monotonic', side_effect=lambda: clock[0]):
+            provider.get_news("AAPL", "2024-01-01", today)
+            provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+            clock[0] += 10
+            provider.get_news("AAPL", "2024-01-01", today)
+            provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        
+        # Only the range reaching today was fetched again
+        self.assertEqual(provider_class.calls, 3)
+
+    @patch('tradingagents.dataflows.providers.base.get_config', return_value={"provider_cache_ttl": 60})
+    def test_same_named_classes_do_not_share_cache_entries(self, mock_get_config):
+        """Test that the cache key uses the class itself rather than its name."""
+        first = self._counting_provider()
+        second = self._counting_provider()
+        
+        first("/tmp/data").get_news("AAPL", "2024-01-01", "2024-01-07")
+        second("/tmp/data").get_news("AAPL", "2024-01-01", "2024-01-07")
+        
+        self.assertEqual((first.calls, second.calls), (1, 1))
+
+    @patch('tradingagents.dataflows.providers.base.get_config', return_value={"provider_cache_ttl": 60})
+    def test_providers_can_opt_out_of_response_cache(self, mock_get_config):
+        """Test that CACHE_RESPONSES = False sends every call to the provider."""
+        provider_class = self._counting_provider()
+        provider_class.CACHE_RESPONSES = False
+        provider = provider_class("/tmp/data")
+        
+        provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        
+        self.assertEqual(provider_class.calls, 2)
+
+    @patch('tradingagents.dataflows.providers.base.get_config', return_value={"provider_cache_ttl": 0})
+    def test_zero_ttl_disables_cache(self, mock_get_config):
+        """Test that a TTL of 0 sends every call to the provider."""
+        provider_class = self._counting_provider()
+        provider = provider_class("/tmp/data")
+        
+        provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        
+        self.assertEqual(provider_class.calls, 2)
+
+    @patch('tradingagents.dataflows.providers.base.get_config', return_value={"provider_cache_ttl": 60})
+    def test_concurrent_misses_share_one_request(self, mock_get_config):
+        """Test that concurrent calls for the same key wait on the first request."""
+        release = threading.Event()
+        calls = []
+
+        class SlowProvider(DataProvider):
+            def get_news(self, ticker, start_date, end_date):
+                calls.append(ticker)
+                release.wait(timeout=2)
+                return {start_date: [{"headline": ticker}]}
+            
+            def get_insider_sentiment(self, ticker, start_date, end_date):
+                return {}
+            
+            def get_insider_transactions(self, ticker, start_date, end_date):
+                return {}
+
+        provider = SlowProvider("/tmp/data")
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(provider.get_news("AAPL", "2024-01-01", "2024-01-07")))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        # Give the followers a moment to queue behind the leader
+        threads[-1].join(0.02)
+        self.assertEqual(calls, ["AAPL"])
+        
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(calls, ["AAPL"])
+        self.assertEqual(results, [{"2024-01-01": [{"headline": "AAPL"}]}] * 3)
+
+    @patch('tradingagents.dataflows.providers.base.get_config', return_value={"provider_cache_ttl": 60})
+    def test_override_calling_super_does_not_deadlock(self, mock_get_config):
+        """Test that a cached override calling the cached parent method re-enters cleanly."""
+        parent = self._counting_provider()
+
+        class ChildProvider(parent):
+            def get_news(self, ticker, start_date, end_date):
+                news = super().get_news(ticker, start_date, end_date)
+                news["child"] = True
+                return news
+
+        provider = ChildProvider("/tmp/data")
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(provider.get_news("AAPL", "2024-01-01", "2024-01-07")),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(2)
+        
+        self.assertFalse(thread.is_alive(), "get_news deadlocked on its own in-flight call")
+        self.assertEqual(result, [{"2024-01-01": [{"headline": "AAPL"}], "child": True}])
+        self.assertEqual(provider.get_news("AAPL", "2024-01-01", "2024-01-07"), result[0])
+        self.assertEqual(parent.calls, 1)
+
     def test_incomplete_implementation_fails(self):
         """Test that incomplete implementations cannot be instantiated."""
         
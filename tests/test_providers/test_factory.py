@@ -2,90 +2,116 @@
 Tests for the DataProviderFactory.
 """
 
+import pathlib
+import subprocess
+import sys
 import unittest
-from unittest.mock import patch, MagicMock
+import pytest
+from types import MappingProxyType
+from unittest.mock import patch
 from tradingagents.dataflows.providers.factory import DataProviderFactory
 from tradingagents.dataflows.providers.base import DataProvider
 from tradingagents.dataflows.providers.finnhub_provider import FinnhubProvider
 from tradingagents.dataflows.providers.twelvedata_provider import TwelveDataProvider
 
+# Unit tests must mock time; anything that really sleeps trips this
+pytestmark = pytest.mark.timeout(1)
 
+
+# Default registry contents, captured once at import
+_DEFAULT_PROVIDERS = MappingProxyType({
+    "finnhub": FinnhubProvider,
+    "twelvedata": TwelveDataProvider,
+})
+
+
+@pytest.mark.unit
 class TestDataProviderFactory(unittest.TestCase):
     """Test cases for the DataProviderFactory."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Install one fake config lookup for the whole class."""
+        cls.fake_config = {}
+        cls._config_patcher = patch(
+            'tradingagents.dataflows.config.get_config',
+            new=lambda: cls.fake_config,
+        )
+        cls._config_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the real config lookup."""
+        cls._config_patcher.stop()
+
     def setUp(self):
         """Set up test fixtures."""
-        # Reset the factory's registry to default state
-        DataProviderFactory._providers = {
-            "finnhub": FinnhubProvider,
-            "twelvedata": TwelveDataProvider,
-        }
-
-    @patch('tradingagents.dataflows.config.get_config')
-    def test_get_provider_default_finnhub(self, mock_get_config):
+        self.fake_config.clear()
+        DataProviderFactory.clear_cache()
+        # Reset the shared registry in place if a test changed it
+        if DataProviderFactory._providers != _DEFAULT_PROVIDERS:
+            DataProviderFactory._providers.clear()
+            DataProviderFactory._providers.update(_DEFAULT_PROVIDERS)
+
+    def test_get_provider_default_finnhub(self):
         """Test getting the default provider (Finnhub)."""
-        mock_get_config.return_value = {
+        self.fake_config.update({
             "data_provider": "finnhub",
             "data_dir": "/tmp/test_data"
-        }
+        })
         
         provider = DataProviderFactory.get_provider()
         self.assertIsInstance(provider, FinnhubProvider)
         self.assertEqual(provider.data_dir, "/tmp/test_data")
 
-    @patch('tradingagents.dataflows.config.get_config')
-    def test_get_provider_explicit_name(self, mock_get_config):
+    def test_get_provider_explicit_name(self):
         """Test getting a provider by explicit name."""
-        mock_get_config.return_value = {
+        self.fake_config.update({
             "data_provider": "finnhub",
             "data_dir": "/tmp/test_data"
-        }
+        })
         
         provider = DataProviderFactory.get_provider("twelvedata")
         self.assertIsInstance(provider, TwelveDataProvider)
         self.assertEqual(provider.data_dir, "/tmp/test_data")
 
-    @patch('tradingagents.dataflows.config.get_config')
-    def test_get_provider_with_explicit_data_dir(self, mock_get_config):
+    def test_get_provider_with_explicit_data_dir(self):
         """Test getting a provider with explicit data directory."""
-        mock_get_config.return_value = {
+        self.fake_config.update({
             "data_provider": "finnhub",
             "data_dir": "/tmp/default"
-        }
+        })
         
         provider = DataProviderFactory.get_provider("finnhub", "/tmp/custom")
         self.assertIsInstance(provider, FinnhubProvider)
         self.assertEqual(provider.data_dir, "/tmp/custom")
 
-    @patch('tradingagents.dataflows.config.get_config')
-    def test_get_provider_config_fallback(self, mock_get_config):
+    def test_get_provider_config_fallback(self):
         """Test provider selection falls back to config when no provider specified."""
-        mock_get_config.return_value = {
+        self.fake_config.update({
             "data_provider": "twelvedata",
             "data_dir": "/tmp/test"
-        }
+        })
         
         provider = DataProviderFactory.get_provider()
         self.assertIsInstance(provider, TwelveDataProvider)
 
-    @patch('tradingagents.dataflows.config.get_config')
-    def test_get_provider_missing_config_uses_finnhub_default(self, mock_get_config):
+    def test_get_provider_missing_config_uses_finnhub_default(self):
         """Test that missing data_provider config defaults to Finnhub."""
-        mock_get_config.return_value = {
+        self.fake_config.update({
             "data_dir": "/tmp/test"
             # No data_provider key
-        }
+        })
         
         provider = DataProviderFactory.get_provider()
         self.assertIsInstance(provider, FinnhubProvider)
 
-    @patch('tradingagents.dataflows.config.get_config')
-    def test_get_provider_missing_data_dir_config(self, mock_get_config):
+    def test_get_provider_missing_data_dir_config(self):
         """Test that missing data_dir config defaults to empty string."""
-        mock_get_config.return_value = {
+        self.fake_config.update({
             "data_provider": "finnhub"
             # No data_dir key
-        }
+        })
         
         provider = DataProviderFactory.get_provider()
         self.assertIsInstance(provider, FinnhubProvider)
@@ -99,10 +125,9 @@ class TestDataProviderFactory(unittest.TestCase):
         self.assertIn("Unknown data provider 'unknown_provider'", str(context.exception))
         self.assertIn("Available providers:", str(context.exception))
 
-    @patch('tradingagents.dataflows.config.get_config')
-    def test_get_provider_case_insensitive(self, mock_get_config):
+    def test_get_provider_case_insensitive(self):
         """Test that provider names are case-insensitive."""
-        mock_get_config.return_value = {"data_dir": "/tmp/test"}
+        self.fake_config.update({"data_dir": "/tmp/test"})
         
         provider1 = DataProviderFactory.get_provider("FINNHUB")
         provider2 = DataProviderFactory.get_provider("Finnhub")
@@ -112,24 +137,135 @@ class TestDataProviderFactory(unittest.TestCase):
         self.assertIsInstance(provider2, FinnhubProvider)
         self.assertIsInstance(provider3, FinnhubProvider)
 
-    @patch('tradingagents.dataflows.config.get_config')
-    def test_get_provider_whitespace_normalization(self, mock_get_config):
+    def test_get_provider_whitespace_normalization(self):
         """Test that provider names are normalized (whitespace removed)."""
-        mock_get_config.return_value = {"data_dir": "/tmp/test"}
+        self.fake_config.update({"data_dir": "/tmp/test"})
         
         provider = DataProviderFactory.get_provider("  finnhub  ")
         self.assertIsInstance(provider, FinnhubProvider)
 
+    def test_get_provider_normalization_is_cached(self):
+        """Test that repeated lookups reuse the cached name normalization."""
+        self.fake_config.update({"data_dir": "/tmp/test"})
+        DataProviderFactory._normalize.cache_clear()
+        
+        DataProviderFactory.get_provider("  Finnhub  ")
+        DataProviderFactory.get_provider("  Finnhub  ")
+        
+        self.assertGreater(DataProviderFactory._normalize.cache_info().hits, 0)
+
+    def test_get_provider_canonical_name_skips_normalization(self):
+        """Test that an exact registry key is looked up without normalizing."""
+        self.fake_config.update({"data_dir": "/tmp/test"})
+        DataProviderFactory._normalize.cache_clear()
+        
+        provider = DataProviderFactory.get_provider("twelvedata")
+        
+        self.assertIsInstance(provider, TwelveDataProvider)
+        self.assertEqual(DataProviderFactory._normalize.cache_info().currsize, 0)
+
+    def test_get_provider_reuses_instances(self):
+        """Test that identical lookups share one provider instance."""
+        provider1 = DataProviderFactory.get_provider("finnhub", "/tmp/a")
+        provider2 = DataProviderFactory.get_provider("FINNHUB", "/tmp/a")
+        provider3 = DataProviderFactory.get_provider("finnhub", "/tmp/b")
+        
+        self.assertIs(provider1, provider2)
+        self.assertIsNot(provider1, provider3)
+
+    @patch('tradingagents.dataflows.config.get_config_version', side_effect=[1, 2])
+    def test_get_provider_rebuilds_after_config_change(self, mock_version):
+        """Test that a new config version yields a fresh provider instance."""
+        provider1 = DataProviderFactory.get_provider("finnhub", "/tmp/a")
+        provider2 = DataProviderFactory.get_provider("finnhub", "/tmp/a")
+        
+        self.assertIsNot(provider1, provider2)
+
+    def test_named_subclass_registers_itself(self):
+        """Test that declaring a provider with provider_name= registers it without the factory."""
+        self.addCleanup(DataProviderFactory._providers.pop, "auto", None)
+        
+        class AutoProvider(DataProvider, provider_name="Auto"):
+            def get_news(self, ticker, start_date, end_date):
+                return {}
+            
+            def get_insider_sentiment(self, ticker, start_date, end_date):
+                return {}
+            
+            def get_insider_transactions(self, ticker, start_date, end_date):
+                return {}
+        
+        self.assertIs(DataProviderFactory._providers["auto"], AutoProvider)
+        self.assertEqual(AutoProvider.PROVIDER_NAME, "auto")
+        self.assertIsInstance(DataProviderFactory.get_provider("auto", "/tmp/a"), AutoProvider)
+
     def test_list_providers(self):
         """Test listing available providers."""
         providers = DataProviderFactory.list_providers()
         expected_providers = ["finnhub", "twelvedata"]
         self.assertEqual(set(providers), set(expected_providers))
 
-    @patch('tradingagents.dataflows.config.get_config')
-    def test_register_provider(self, mock_get_config):
+    def test_get_provider_resolves_lazy_spec(self):
+        """Test that a "module:Class" registry entry is imported on first use."""
+        self.addCleanup(DataProviderFactory._providers.pop, "lazy", None)
+        DataProviderFactory._providers["lazy"] = (
+            "tradingagents.dataflows.providers.finnhub_provider:FinnhubProvider"
+        )
+        
+        provider = DataProviderFactory.get_provider("lazy", "/tmp/a")
+        
+        self.assertIsInstance(provider, FinnhubProvider)
+        self.assertIs(DataProviderFactory._providers["lazy"], FinnhubProvider)
+
+    def test_providers_view_resolves_lazy_specs(self):
+        """Test that reading a provider through the public view imports it instead of exposing the spec."""
+        self.addCleanup(DataProviderFactory._providers.pop, "lazy", None)
+        DataProviderFactory._providers["lazy"] = (
+            "tradingagents.dataflows.providers.finnhub_provider:FinnhubProvider"
+        )
+        
+        self.assertIs(DataProviderFactory.providers["lazy"], FinnhubProvider)
+        self.assertIs(DataProviderFactory._providers["lazy"], FinnhubProvider)
+
+    @pytest.mark.timeout(30)
+    def test_importing_package_does_not_import_providers(self):
+        """Test that provider modules load on first use rather than with the package."""
+        script = (
+            "import sys\n"
+            "import tradingagents.dataflows.providers as providers\n"
+            "loaded = lambda: sorted(m for m in sys.modules if m.endswith(('finnhub_provider', 'twelvedata_provider')))\n"
+            "assert loaded() == [], loaded()\n"
+            "assert providers.TwelveDataProvider.PROVIDER_NAME == 'twelvedata'\n"
+            "assert loaded() == ['tradingagents.dataflows.providers.twelvedata_provider'], loaded()\n"
+        )
+        root = pathlib.Path(__file__).resolve().parents[2]
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, cwd=root)
+        
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_get_provider_overrides(self):
+        """Test that per-call overrides take precedence without touching the registry."""
+        provider = DataProviderFactory.get_provider(
+            "finnhub", "/tmp/a", overrides={"finnhub": TwelveDataProvider, "extra": FinnhubProvider}
+        )
+        
+        self.assertIsInstance(provider, TwelveDataProvider)
+        self.assertIsInstance(
+            DataProviderFactory.get_provider("extra", "/tmp/a", overrides={"extra": FinnhubProvider}),
+            FinnhubProvider,
+        )
+        self.assertNotIn("extra", DataProviderFactory.list_providers())
+
+    def test_providers_view_is_read_only(self):
+        """Test that the public registry view tracks registrations but rejects writes."""
+        self.assertIs(DataProviderFactory.providers["finnhub"], FinnhubProvider)
+        
+        with self.assertRaises(TypeError):
+            DataProviderFactory.providers["custom"] = FinnhubProvider
+
+    def test_register_provider(self):
         """Test registering a new provider."""
-        mock_get_config.return_value = {"data_dir": "/tmp/test"}
+        self.fake_config.update({"data_dir": "/tmp/test"})
         
         class CustomProvider(DataProvider):
             def get_news(self, ticker, start_date, end_date):
@@ -141,7 +277,8 @@ class TestDataProviderFactory(unittest.TestCase):
             def get_insider_transactions(self, ticker, start_date, end_date):
                 return {}
 
-        # Register the new provider
+        # Register the new provider, removing it again even if an assertion fails
+        self.addCleanup(DataProviderFactory._providers.pop, "custom", None)
         DataProviderFactory.register_provider("custom", CustomProvider)
         
         # Verify it's in the list
@@ -163,10 +300,9 @@ class TestDataProviderFactory(unittest.TestCase):
         
         self.assertIn("Provider class must inherit from DataProvider", str(context.exception))
 
-    @patch('tradingagents.dataflows.config.get_config')
-    def test_register_provider_name_normalization(self, mock_get_config):
+    def test_register_provider_name_normalization(self):
         """Test that provider registration normalizes names."""
-        mock_get_config.return_value = {"data_dir": "/tmp/test"}
+        self.fake_config.update({"data_dir": "/tmp/test"})
         
         class AnotherProvider(DataProvider):
             def get_news(self, ticker, start_date, end_date):
@@ -179,6 +315,7 @@ class TestDataProviderFactory(unittest.TestCase):
                 return {}
 
         # Register with uppercase and whitespace
+        self.addCleanup(DataProviderFactory._providers.pop, "another", None)
         DataProviderFactory.register_provider("  ANOTHER  ", AnotherProvider)
         
         # Should be accessible with normalized name
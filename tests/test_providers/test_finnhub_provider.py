@@ -2,34 +2,101 @@
 Tests for the FinnhubProvider.
 """
 
-import unittest
-from unittest.mock import patch, MagicMock
+import threading
+import pytest
+from unittest.mock import MagicMock
+from tradingagents.dataflows import finnhub_utils
 from tradingagents.dataflows.providers.finnhub_provider import FinnhubProvider
 from tradingagents.dataflows.providers.base import DataProvider
 
+# Unit tests must mock time; anything that really sleeps trips this
+pytestmark = pytest.mark.timeout(1)
 
-class TestFinnhubProvider(unittest.TestCase):
+
+DATA_DIR = "/tmp/test_data"
+
+
+@pytest.fixture(scope="class")
+def provider():
+    """Build one FinnhubProvider and share it across the test class."""
+    return FinnhubProvider(DATA_DIR)
+
+
+@pytest.fixture(params=["/tmp/test1", "/tmp/test2", "/home/user/data"])
+def data_dir_provider(request):
+    """Build a separate FinnhubProvider for each data directory under test."""
+    return FinnhubProvider(request.param)
+
+
+@pytest.fixture(autouse=True)
+def mock_get_data(monkeypatch):
+    """Replace the on-disk Finnhub loader for every test."""
+    mock = MagicMock(return_value={})
+    monkeypatch.setattr(
+        "tradingagents.dataflows.providers.finnhub_provider.get_data_in_range",
+        mock,
+    )
+    return mock
+
+
+@pytest.mark.unit
+class TestFinnhubProvider:
     """Test cases for the FinnhubProvider."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.data_dir = "/tmp/test_data"
-        self.provider = FinnhubProvider(self.data_dir)
+    # Expected get_data_in_range arguments for the AAPL sample window
+    _NEWS_CALL = ("AAPL", "2024-01-01", "2024-01-07", "news_data", DATA_DIR)
+    _SENTI_CALL = ("AAPL", "2024-01-01", "2024-01-07", "insider_senti", DATA_DIR)
+    _TRANS_CALL = ("AAPL", "2024-01-01", "2024-01-07", "insider_trans", DATA_DIR)
 
-    def test_inherits_from_data_provider(self):
+    def test_inherits_from_data_provider(self, provider):
         """Test that FinnhubProvider inherits from DataProvider."""
-        self.assertIsInstance(self.provider, DataProvider)
+        assert isinstance(provider, DataProvider)
 
-    def test_initialization(self):
+    def test_initialization(self, provider):
         """Test that FinnhubProvider initializes correctly."""
-        self.assertEqual(self.provider.data_dir, self.data_dir)
+        assert provider.data_dir == DATA_DIR
+
+    def test_missing_data_dir_warns_once_at_init(self, tmp_path, caplog):
+        """Test that a data_dir without finnhub_data is reported when the provider is built."""
+        (tmp_path / "finnhub_data").mkdir()
+        
+        with caplog.at_level("WARNING"):
+            FinnhubProvider(str(tmp_path))
+            assert caplog.records == []
+            FinnhubProvider(str(tmp_path / "missing"))
+        
+        assert len(caplog.records) == 1
+        assert "Finnhub data not found" in caplog.records[0].getMessage()
+
+    def test_missing_data_dir_still_fails_on_read(self, tmp_path, monkeypatch):
+        """Test that a provider built for a missing data_dir raises FileNotFoundError when read."""
+        monkeypatch.setattr(
+            "tradingagents.dataflows.providers.finnhub_provider.get_data_in_range",
+            finnhub_utils.get_data_in_range,
+        )
+        provider = FinnhubProvider(str(tmp_path / "missing"))
+        
+        with pytest.raises(FileNotFoundError):
+            provider.get_news("AAPL", "2024-01-01", "2024-01-07")
 
-    def test_get_provider_name(self):
+    def test_file_reads_bypass_response_cache(self, mock_get_data, provider, monkeypatch):
+        """Test that Finnhub reads are not TTL-cached, so rewritten files are seen at once."""
+        monkeypatch.setattr(
+            "tradingagents.dataflows.providers.base.get_config",
+            lambda: {"provider_cache_ttl": 60},
+        )
+        mock_get_data.return_value = {"2024-01-01": [{"headline": "old"}]}
+        provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        mock_get_data.return_value = {"2024-01-01": [{"headline": "new"}]}
+        
+        assert provider.get_news("AAPL", "2024-01-01", "2024-01-07") == mock_get_data.return_value
+        assert mock_get_data.call_count == 2
+
+    def test_get_provider_name(self, provider):
         """Test the get_provider_name method."""
-        self.assertEqual(self.provider.get_provider_name(), "finnhub")
+        assert provider.get_provider_name() == "finnhub"
 
-    @patch('tradingagents.dataflows.providers.finnhub_provider.get_data_in_range')
-    def test_get_news(self, mock_get_data):
+    def test_get_news(self, mock_get_data, provider):
         """Test the get_news method."""
         # Setup mock return value
         expected_data = {
@@ -38,16 +105,14 @@ class TestFinnhubProvider(unittest.TestCase):
         mock_get_data.return_value = expected_data
 
         # Call the method
-        result = self.provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        result = provider.get_news("AAPL", "2024-01-01", "2024-01-07")
 
         # Verify the call
-        mock_get_data.assert_called_once_with(
-            "AAPL", "2024-01-01", "2024-01-07", "news_data", self.data_dir
-        )
-        self.assertEqual(result, expected_data)
+        assert mock_get_data.call_count == 1
+        assert mock_get_data.call_args.args == self._NEWS_CALL
+        assert result == expected_data
 
-    @patch('tradingagents.dataflows.providers.finnhub_provider.get_data_in_range')
-    def test_get_insider_sentiment(self, mock_get_data):
+    def test_get_insider_sentiment(self, mock_get_data, provider):
         """Test the get_insider_sentiment method."""
         # Setup mock return value
         expected_data = {
@@ -56,16 +121,14 @@ class TestFinnhubProvider(unittest.TestCase):
         mock_get_data.return_value = expected_data
 
         # Call the method
-        result = self.provider.get_insider_sentiment("AAPL", "2024-01-01", "2024-01-07")
+        result = provider.get_insider_sentiment("AAPL", "2024-01-01", "2024-01-07")
 
         # Verify the call
-        mock_get_data.assert_called_once_with(
-            "AAPL", "2024-01-01", "2024-01-07", "insider_senti", self.data_dir
-        )
-        self.assertEqual(result, expected_data)
+        assert mock_get_data.call_count == 1
+        assert mock_get_data.call_args.args == self._SENTI_CALL
+        assert result == expected_data
 
-    @patch('tradingagents.dataflows.providers.finnhub_provider.get_data_in_range')
-    def test_get_insider_transactions(self, mock_get_data):
+    def test_get_insider_transactions(self, mock_get_data, provider):
         """Test the get_insider_transactions method."""
         # Setup mock return value
         expected_data = {
@@ -74,95 +137,70 @@ class TestFinnhubProvider(unittest.TestCase):
         mock_get_data.return_value = expected_data
 
         # Call the method
-        result = self.provider.get_insider_transactions("AAPL", "2024-01-01", "2024-01-07")
+        result = provider.get_insider_transactions("AAPL", "2024-01-01", "2024-01-07")
 
         # Verify the call
-        mock_get_data.assert_called_once_with(
-            "AAPL", "2024-01-01", "2024-01-07", "insider_trans", self.data_dir
-        )
-        self.assertEqual(result, expected_data)
+        assert mock_get_data.call_count == 1
+        assert mock_get_data.call_args.args == self._TRANS_CALL
+        assert result == expected_data
 
-    @patch('tradingagents.dataflows.providers.finnhub_provider.get_data_in_range')
-    def test_get_news_empty_result(self, mock_get_data):
+    def test_get_news_empty_result(self, mock_get_data, provider):
         """Test get_news with empty result."""
-        mock_get_data.return_value = {}
-        
-        result = self.provider.get_news("AAPL", "2024-01-01", "2024-01-07")
-        
-        self.assertEqual(result, {})
+        result = provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+
+        assert result == {}
         mock_get_data.assert_called_once()
 
-    @patch('tradingagents.dataflows.providers.finnhub_provider.get_data_in_range')
-    def test_get_insider_sentiment_empty_result(self, mock_get_data):
+    def test_get_insider_sentiment_empty_result(self, mock_get_data, provider):
         """Test get_insider_sentiment with empty result."""
-        mock_get_data.return_value = {}
-        
-        result = self.provider.get_insider_sentiment("AAPL", "2024-01-01", "2024-01-07")
-        
-        self.assertEqual(result, {})
+        result = provider.get_insider_sentiment("AAPL", "2024-01-01", "2024-01-07")
+
+        assert result == {}
         mock_get_data.assert_called_once()
 
-    @patch('tradingagents.dataflows.providers.finnhub_provider.get_data_in_range')
-    def test_get_insider_transactions_empty_result(self, mock_get_data):
+    def test_get_insider_transactions_empty_result(self, mock_get_data, provider):
         """Test get_insider_transactions with empty result."""
-        mock_get_data.return_value = {}
-        
-        result = self.provider.get_insider_transactions("AAPL", "2024-01-01", "2024-01-07")
-        
-        self.assertEqual(result, {})
+        result = provider.get_insider_transactions("AAPL", "2024-01-01", "2024-01-07")
+
+        assert result == {}
         mock_get_data.assert_called_once()
 
-    @patch('tradingagents.dataflows.providers.finnhub_provider.get_data_in_range')
-    def test_method_parameters_passed_correctly(self, mock_get_data):
+    @pytest.mark.parametrize("ticker,start_date,end_date", [
+        ("AAPL", "2024-01-01", "2024-01-07"),
+        ("TSLA", "2023-12-01", "2023-12-31"),
+        ("GOOGL", "2024-06-15", "2024-06-30"),
+    ])
+    @pytest.mark.parametrize("method,data_type", [
+        ("get_news", "news_data"),
+        ("get_insider_sentiment", "insider_senti"),
+        ("get_insider_transactions", "insider_trans"),
+    ])
+    def test_method_parameters_passed_correctly(self, mock_get_data, provider, method, data_type, ticker, start_date, end_date):
         """Test that all method parameters are passed correctly to underlying function."""
-        mock_get_data.return_value = {}
-        
-        # Test various parameter combinations
-        test_cases = [
-            ("AAPL", "2024-01-01", "2024-01-07"),
-            ("TSLA", "2023-12-01", "2023-12-31"),
-            ("GOOGL", "2024-06-15", "2024-06-30"),
-        ]
-        
-        for ticker, start_date, end_date in test_cases:
-            # Reset mock
-            mock_get_data.reset_mock()
-            
-            # Test news
-            self.provider.get_news(ticker, start_date, end_date)
-            mock_get_data.assert_called_with(ticker, start_date, end_date, "news_data", self.data_dir)
-            
-            # Reset mock
-            mock_get_data.reset_mock()
-            
-            # Test insider sentiment
-            self.provider.get_insider_sentiment(ticker, start_date, end_date)
-            mock_get_data.assert_called_with(ticker, start_date, end_date, "insider_senti", self.data_dir)
-            
-            # Reset mock
-            mock_get_data.reset_mock()
-            
-            # Test insider transactions
-            self.provider.get_insider_transactions(ticker, start_date, end_date)
-            mock_get_data.assert_called_with(ticker, start_date, end_date, "insider_trans", self.data_dir)
-
-    @patch('tradingagents.dataflows.providers.finnhub_provider.get_data_in_range')
-    def test_data_dir_passed_correctly(self, mock_get_data):
+        getattr(provider, method)(ticker, start_date, end_date)
+        mock_get_data.assert_called_once_with(ticker, start_date, end_date, data_type, DATA_DIR)
+
+    def test_data_dir_passed_correctly(self, mock_get_data, data_dir_provider):
         """Test that data_dir is passed correctly to underlying function."""
-        mock_get_data.return_value = {}
-        
-        # Test with different data directories
-        test_data_dirs = ["/tmp/test1", "/tmp/test2", "/home/user/data"]
-        
-        for data_dir in test_data_dirs:
-            provider = FinnhubProvider(data_dir)
-            
-            # Reset mock
-            mock_get_data.reset_mock()
-            
-            provider.get_news("AAPL", "2024-01-01", "2024-01-07")
-            mock_get_data.assert_called_with("AAPL", "2024-01-01", "2024-01-07", "news_data", data_dir)
+        data_dir_provider.get_news("AAPL", "2024-01-01", "2024-01-07")
+        mock_get_data.assert_called_once_with(
+            "AAPL", "2024-01-01", "2024-01-07", "news_data", data_dir_provider.data_dir
+        )
+
+    def test_get_data_range_reads_kinds_concurrently(self, mock_get_data, provider):
+        """Test that get_data_range overlaps the three file reads."""
+        # Each read waits until all three are in flight; serial reads would time out
+        barrier = threading.Barrier(3, timeout=2)
 
+        def fake_get_data(ticker, start_date, end_date, data_type, data_dir):
+            barrier.wait()
+            return {start_date: [{"type": data_type}]}
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+        mock_get_data.side_effect = fake_get_data
+        result = provider.get_data_range("AAPL", "2024-01-01", "2024-01-07")
+        
+        assert result == {
+            "news": {"2024-01-01": [{"type": "news_data"}]},
+            "insider_sentiment": {"2024-01-01": [{"type": "insider_senti"}]},
+            "insider_transactions": {"2024-01-01": [{"type": "insider_trans"}]},
+        }
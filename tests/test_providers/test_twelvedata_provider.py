@@ -2,26 +2,66 @@
 Tests for the TwelveDataProvider.
 """
 
+import asyncio
+import inspect
+import json
+import pathlib
 import unittest
+import pytest
+import requests
+import threading
 from unittest.mock import patch, Mock, MagicMock
-from tradingagents.dataflows.providers.twelvedata_provider import TwelveDataProvider
+from tradingagents.dataflows.providers.twelvedata_provider import TokenBucket, TwelveDataProvider
 from tradingagents.dataflows.providers.base import DataProvider
-import time
 
+# Unit tests must mock time; anything that really sleeps trips this
+pytestmark = pytest.mark.timeout(1)
 
-class TestTwelveDataProvider(unittest.TestCase):
-    """Test cases for the TwelveDataProvider."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.data_dir = "/tmp/test_data"
-        
+# Recorded TwelveData API responses, one JSON file per endpoint
+FIXTURES_DIR = pathlib.Path(__file__).parent / "fixtures" / "twelvedata"
+
+
+class _TwelveDataTestCase(unittest.TestCase):
+    """Shared provider fixture and helpers for the TwelveData test cases."""
+
+    data_dir = "/tmp/test_data"
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up one provider shared by every test in the class."""
         # Mock the config to avoid requiring actual API key
-        with patch('tradingagents.dataflows.providers.twelvedata_provider.get_config') as mock_config:
-            mock_config.return_value = {
-                "twelvedata_api_key": "test_api_key_123"
-            }
-            self.provider = TwelveDataProvider(self.data_dir)
+        cls._config_patcher = patch(
+            'tradingagents.dataflows.providers.twelvedata_provider.get_config',
+            return_value={"twelvedata_api_key": "test_api_key_123"},
+        )
+        cls._config_patcher.start()
+        cls.provider = TwelveDataProvider(cls.data_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the config patch started in setUpClass."""
+        cls._config_patcher.stop()
+
+    def setUp(self):
+        """Reset the mutable provider state between tests."""
+        self.provider.api_key = "test_api_key_123"
+        self.provider.rate_limiter = TokenBucket(10.0, 2)
+
+    def _patch_clock(self, times):
+        """Replace the provider's clock with scripted readings and capture sleeps."""
+        time_patcher = patch('tradingagents.dataflows.providers.twelvedata_provider.time.monotonic', side_effect=times)
+        sleep_patcher = patch('tradingagents.dataflows.providers.twelvedata_provider.time.sleep')
+        mock_time = time_patcher.start()
+        mock_sleep = sleep_patcher.start()
+        self.addCleanup(time_patcher.stop)
+        self.addCleanup(sleep_patcher.stop)
+        return mock_time, mock_sleep
+
+
+@pytest.mark.unit
+class TestTwelveDataProvider(_TwelveDataTestCase):
+    """Test cases for the TwelveDataProvider."""
 
     def test_inherits_from_data_provider(self):
         """Test that TwelveDataProvider inherits from DataProvider."""
@@ -45,82 +85,67 @@ class TestTwelveDataProvider(unittest.TestCase):
         self.assertEqual(self.provider.get_provider_name(), "twelvedata")
 
     def test_rate_limiting(self):
-        """Test that rate limiting works correctly."""
-        start_time = time.time()
+        """Test that a burst up to capacity passes and the next call waits for a token."""
+        _, mock_sleep = self._patch_clock([100.0, 100.0, 100.0, 100.01])
+        self.provider.rate_limiter = TokenBucket(10.0, 2)
+
         self.provider._rate_limit()
-        first_call_time = time.time()
-        
         self.provider._rate_limit()
-        second_call_time = time.time()
-        
-        # Second call should be delayed
-        time_diff = second_call_time - first_call_time
-        self.assertGreaterEqual(time_diff, self.provider.rate_limit_delay * 0.9)  # Allow some tolerance
+        mock_sleep.assert_not_called()
 
-    @patch('tradingagents.dataflows.providers.twelvedata_provider.requests.Session.get')
-    def test_make_request_success(self, mock_get):
-        """Test successful API request."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"status": "ok", "data": []}
-        mock_get.return_value = mock_response
-        
-        result = self.provider._make_request("test_endpoint", {"param": "value"})
-        
-        self.assertEqual(result, {"status": "ok", "data": []})
-        mock_get.assert_called_once()
+        # Third call lands 10ms later with an empty bucket; one token takes 100ms
+        self.provider._rate_limit()
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 0.09)
+        # The token is reserved up front, leaving the bucket in debt until it refills
+        self.assertAlmostEqual(self.provider.rate_limiter.tokens, -0.9)
 
-    @patch('tradingagents.dataflows.providers.twelvedata_provider.requests.Session.get')
-    def test_make_request_api_error(self, mock_get):
-        """Test API error response."""
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"status": "error", "message": "API limit exceeded"}
-        mock_get.return_value = mock_response
+    def test_session_retries_transient_errors(self):
+        """Test that the shared session retries throttled and server-error responses."""
+        retries = self.provider.session.get_adapter("https://api.twelvedata.com").max_retries
         
-        result = self.provider._make_request("test_endpoint", {"param": "value"})
-        
-        self.assertIsNone(result)
+        self.assertEqual(retries.total, 3)
+        self.assertIn(429, retries.status_forcelist)
+        self.assertIn(503, retries.status_forcelist)
 
-    @patch('tradingagents.dataflows.providers.twelvedata_provider.requests.Session.get')
-    def test_make_request_network_error(self, mock_get):
-        """Test network error handling."""
-        mock_get.side_effect = Exception("Network error")
+    def test_rate_limiter_refills_over_time(self):
+        """Test that idle time refills the bucket without exceeding capacity."""
+        _, mock_sleep = self._patch_clock([100.0, 100.0, 100.0, 160.0, 160.0, 160.0])
+        bucket = TokenBucket(10.0, 2)
         
-        result = self.provider._make_request("test_endpoint", {"param": "value"})
+        for _ in range(5):
+            bucket.acquire()
         
-        self.assertIsNone(result)
+        # Two calls at t=100 drain the bucket; a minute later only two fit again
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.assertEqual(bucket.tokens, -1.0)
 
-    def test_make_request_without_api_key(self):
-        """Test API request without API key."""
-        self.provider.api_key = ""
+    def test_rate_limiter_sleeps_outside_its_lock(self):
+        """Test that a throttled caller does not hold the lock while it sleeps."""
+        # Slow enough that the second call always has to wait
+        bucket = TokenBucket(0.001, 1)
+        held = []
         
-        result = self.provider._make_request("test_endpoint", {"param": "value"})
+        with patch('tradingagents.dataflows.providers.twelvedata_provider.time.sleep',
+                   side_effect=lambda wait: held.append(bucket._lock.locked())):
+            bucket.acquire()
+            bucket.acquire()
         
-        self.assertIsNone(result)
+        self.assertEqual(held, [False])
 
-    @patch('tradingagents.dataflows.providers.twelvedata_provider.TwelveDataProvider._make_request')
-    def test_get_news_success(self, mock_request):
-        """Test successful news retrieval."""
-        mock_request.return_value = {
-            "data": [
-                {
-                    "title": "Test News Title",
-                    "content": "Test news content",
-                    "source": "Test Source",
-                    "url": "https://example.com",
-                    "datetime": "2024-01-15T10:30:00Z"
-                }
-            ]
-        }
-        
-        result = self.provider.get_news("AAPL", "2024-01-01", "2024-01-31")
+    def test_rate_limiter_is_shared_per_api_key(self):
+        """Test that providers using the same key draw from one quota."""
+        with patch('tradingagents.dataflows.providers.twelvedata_provider.get_config') as mock_config:
+            mock_config.return_value = {"twelvedata_api_key": "shared_key"}
+            first = TwelveDataProvider(self.data_dir)
+            second = TwelveDataProvider(self.data_dir)
+            mock_config.return_value = {"twelvedata_api_key": "other_key"}
+            other = TwelveDataProvider(self.data_dir)
         
-        self.assertIn("2024-01-15", result)
-        self.assertEqual(len(result["2024-01-15"]), 1)
-        self.assertEqual(result["2024-01-15"][0]["headline"], "Test News Title")
+        self.assertIs(first.rate_limiter, second.rate_limiter)
+        self.assertIsNot(first.rate_limiter, other.rate_limiter)
 
-    @patch('tradingagents.dataflows.providers.twelvedata_provider.TwelveDataProvider._make_request')
+    @patch.object(TwelveDataProvider, '_make_request')
     def test_get_news_empty_response(self, mock_request):
         """Test news retrieval with empty response."""
         mock_request.return_value = None
@@ -129,30 +154,79 @@ class TestTwelveDataProvider(unittest.TestCase):
         
         self.assertEqual(result, {})
 
-    @patch('tradingagents.dataflows.providers.twelvedata_provider.TwelveDataProvider._make_request')
+    @patch.object(TwelveDataProvider, '_make_request')
     def test_get_news_invalid_date_format(self, mock_request):
-        """Test news retrieval with invalid date format."""
-        with self.assertRaises(ValueError):
-            self.provider.get_news("AAPL", "invalid-date", "2024-01-31")
+        """Test news retrieval with invalid date format returns an empty result without a request."""
+        result = self.provider.get_news("AAPL", "invalid-date", "2024-01-31")
+        
+        self.assertEqual(result, {})
+        mock_request.assert_not_called()
 
-    @patch('tradingagents.dataflows.providers.twelvedata_provider.TwelveDataProvider._make_request')
-    def test_get_insider_sentiment_success(self, mock_request):
-        """Test successful insider sentiment retrieval."""
-        mock_request.return_value = {
-            "data": [
-                {
-                    "date": "2024-01-15",
-                    "rating": "Strong Buy",
-                }
-            ]
-        }
+    @patch.object(TwelveDataProvider, '_make_request')
+    def test_get_insider_sentiment_invalid_date_format(self, mock_request):
+        """Test that insider sentiment treats bad dates like get_news, before any request."""
+        result = self.provider.get_insider_sentiment("AAPL", "2024-01-01", "invalid-date")
+        
+        self.assertEqual(result, {})
+        mock_request.assert_not_called()
+
+    @patch.object(TwelveDataProvider, '_make_request')
+    def test_get_news_groups_articles_by_date(self, mock_request):
+        """Test that articles are bucketed by date, range-checked, and bad dates skipped."""
+        mock_request.return_value = {"data": [
+            {"title": "In range", "datetime": "2024-01-15T10:30:00Z"},
+            {"title": "Same day", "datetime": "2024-01-15 18:00:00"},
+            {"title": "Too late", "datetime": "2024-02-01T09:00:00Z"},
+            {"title": "Unparseable", "datetime": "yesterday"},
+            {"title": "Undated"},
+        ]}
+        
+        result = self.provider.get_news("AAPL", "2024-01-01", "2024-01-31")
+        
+        self.assertEqual(list(result), ["2024-01-15"])
+        self.assertEqual([a["headline"] for a in result["2024-01-15"]], ["In range", "Same day"])
+
+    @patch.object(TwelveDataProvider, '_make_request')
+    def test_get_insider_sentiment_scores_ratings(self, mock_request):
+        """Test that ratings are scored per day and out-of-range or malformed dates skipped."""
+        mock_request.return_value = {"data": [
+            {"date": "2024-01-15", "rating": "Strong Buy"},
+            {"date": "2024-01-15", "rating": "Moderate Buy"},
+            {"date": "2024-01-16", "rating": "Sell"},
+            {"date": "2024-01-17", "rating": "Hold"},
+            {"date": "2024-02-01", "rating": "Buy"},
+            {"date": "01/18/2024", "rating": "Buy"},
+        ]}
         
         result = self.provider.get_insider_sentiment("AAPL", "2024-01-01", "2024-01-31")
         
-        self.assertIn("2024-01-15", result)
-        self.assertIn("mspr", result["2024-01-15"])
+        self.assertEqual({day: entry["mspr"] for day, entry in result.items()}, {
+            "2024-01-15": 2,
+            "2024-01-16": -1,
+            "2024-01-17": 0,
+        })
+
+    def test_get_news_batch_runs_concurrently(self):
+        """Test that batched news requests overlap instead of running serially."""
+        tickers = ["AAPL", "MSFT", "GOOGL", "TSLA"]
+        # Every call blocks until all four are in flight; serial execution would time out
+        barrier = threading.Barrier(len(tickers), timeout=2)
+
+        def fake_get_news(ticker, start_date, end_date):
+            barrier.wait()
+            return {start_date: [{"headline": ticker}]}
 
-    @patch('tradingagents.dataflows.providers.twelvedata_provider.TwelveDataProvider._make_request')
+        with patch.object(TwelveDataProvider, 'get_news', side_effect=fake_get_news):
+            result = self.provider.get_news_batch(tickers, "2024-01-01", "2024-01-31")
+
+        self.assertEqual(list(result), tickers)
+        self.assertEqual(result["MSFT"], {"2024-01-01": [{"headline": "MSFT"}]})
+
+    def test_get_news_batch_empty(self):
+        """Test batched news retrieval with no tickers."""
+        self.assertEqual(self.provider.get_news_batch([], "2024-01-01", "2024-01-31"), {})
+
+    @patch.object(TwelveDataProvider, '_make_request')
     def test_get_insider_sentiment_empty_response(self, mock_request):
         """Test insider sentiment retrieval with empty response."""
         mock_request.return_value = None
@@ -168,21 +242,7 @@ class TestTwelveDataProvider(unittest.TestCase):
         
         self.assertEqual(result, {})
 
-    @patch('tradingagents.dataflows.providers.twelvedata_provider.TwelveDataProvider._make_request')
-    def test_get_company_profile_success(self, mock_request):
-        """Test successful company profile retrieval."""
-        mock_request.return_value = {
-            "name": "Apple Inc.",
-            "country": "United States",
-            "sector": "Technology"
-        }
-        
-        result = self.provider.get_company_profile("AAPL")
-        
-        self.assertEqual(result["name"], "Apple Inc.")
-        self.assertEqual(result["country"], "United States")
-
-    @patch('tradingagents.dataflows.providers.twelvedata_provider.TwelveDataProvider._make_request')
+    @patch.object(TwelveDataProvider, '_make_request')
     def test_get_company_profile_empty_response(self, mock_request):
         """Test company profile retrieval with empty response."""
         mock_request.return_value = None
@@ -191,6 +251,30 @@ class TestTwelveDataProvider(unittest.TestCase):
         
         self.assertEqual(result, {})
 
+    @patch.object(TwelveDataProvider, '_make_request')
+    def test_get_company_profile_is_cached(self, mock_request):
+        """Test that repeated profile lookups for a ticker reuse the cached response."""
+        mock_request.side_effect = lambda endpoint, params: {"name": params["symbol"]}
+        
+        with patch('tradingagents.dataflows.providers.base.get_config', return_value={"provider_cache_ttl": 60}):
+            first = self.provider.get_company_profile("AAPL")
+            second = self.provider.get_company_profile("AAPL")
+            other = self.provider.get_company_profile("MSFT")
+        
+        self.assertEqual(first, second)
+        self.assertEqual(other, {"name": "MSFT"})
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch.object(TwelveDataProvider, '_make_request')
+    def test_aget_company_profile(self, mock_request):
+        """Test that the async profile variant returns the sync result."""
+        mock_request.return_value = {"name": "Apple Inc."}
+        
+        result = asyncio.run(self.provider.aget_company_profile("AAPL"))
+        
+        self.assertEqual(result, {"name": "Apple Inc."})
+        mock_request.assert_called_once_with("profile", {"symbol": "AAPL"})
+
     def test_parse_date_range_valid(self):
         """Test parsing valid date range."""
         start_dt, end_dt = self.provider._parse_date_range("2024-01-01", "2024-01-31")
@@ -203,33 +287,252 @@ class TestTwelveDataProvider(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.provider._parse_date_range("invalid-date", "2024-01-31")
 
-    def test_methods_accept_parameters(self):
-        """Test that all methods accept the required parameters without error."""
-        # These should not raise any exceptions (though they may return empty results)
-        with patch('tradingagents.dataflows.providers.twelvedata_provider.TwelveDataProvider._make_request') as mock_request:
-            mock_request.return_value = None
-            
-            self.provider.get_news("AAPL", "2024-01-01", "2024-01-07")
-            self.provider.get_insider_sentiment("TSLA", "2023-12-01", "2023-12-31")
-            self.provider.get_insider_transactions("GOOGL", "2024-06-15", "2024-06-30")
+    def test_parse_date_range_rejects_impossible_dates(self):
+        """Test that well-shaped but impossible dates are still rejected."""
+        with self.assertRaises(ValueError):
+            self.provider._parse_date_range("2024-01-01", "2024-02-30")
+
+    def test_parse_date_range_requires_dashed_dates(self):
+        """Test that other ISO 8601 spellings are rejected, since dates are compared lexically."""
+        for bad in ("20240101", "2024-W01-1", "2024-01-01T00:00", " 2024-01-01", "２０２４-01-01"):
+            with self.subTest(bad=bad), self.assertRaises(ValueError):
+                self.provider._parse_date_range(bad, "2024-01-31")
 
     def test_implements_all_abstract_methods(self):
         """Test that TwelveDataProvider implements all required abstract methods."""
-        # This test verifies that the class can be instantiated without TypeError
-        # If any abstract methods were missing, instantiation would fail
-        with patch('tradingagents.dataflows.providers.twelvedata_provider.get_config') as mock_config:
-            mock_config.return_value = {"twelvedata_api_key": "test_key"}
-            provider = TwelveDataProvider("/tmp/test")
+        # setUpClass already instantiated the provider, proving no abstract method is missing
+        provider = self.provider
         
-        # Verify methods exist and are callable
-        self.assertTrue(hasattr(provider, 'get_news'))
-        self.assertTrue(callable(getattr(provider, 'get_news')))
+        # Verify methods exist and are real methods rather than properties
+        for name in ("get_news", "get_insider_sentiment", "get_insider_transactions"):
+            self.assertTrue(inspect.isroutine(getattr(type(provider), name, None)), name)
+
+
+@pytest.mark.integration
+@pytest.mark.timeout(5)
+class TestTwelveDataProviderRequests(_TwelveDataTestCase):
+    """Request/response contract tests for the TwelveDataProvider, run against mocked HTTP."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Patch the HTTP layer and the rate limiter's sleep once for the whole class."""
+        super().setUpClass()
+        cls._get_patcher = patch.object(requests.Session, 'get')
+        cls.mock_get = cls._get_patcher.start()
+        cls._sleep_patcher = patch('tradingagents.dataflows.providers.twelvedata_provider.time.sleep')
+        cls._sleep_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the patches started in setUpClass."""
+        cls._sleep_patcher.stop()
+        cls._get_patcher.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        """Clear recorded calls and canned behavior from the shared HTTP mock."""
+        super().setUp()
+        self.mock_get.reset_mock(return_value=True, side_effect=True)
+
+    def _respond(self, payload):
+        """Answer the next request with ``payload``, whichever JSON decoder the provider uses."""
+        mock_response = Mock(status_code=200)
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = payload
+        mock_response.content = json.dumps(payload).encode()
+        self.mock_get.return_value = mock_response
+        return mock_response
+
+    def _replay(self, endpoint):
+        """Serve a recorded TwelveData response for ``endpoint`` through the real request path."""
+        self._respond(json.loads((FIXTURES_DIR / f"{endpoint}.json").read_text()))
+        return self.mock_get
+
+    def test_make_request_success(self):
+        """Test successful API request."""
+        self._respond({"status": "ok", "data": []})
+        
+        result = self.provider._make_request("test_endpoint", {"param": "value"})
+        
+        self.assertEqual(result, {"status": "ok", "data": []})
+        self.mock_get.assert_called_once()
+
+    def test_make_request_api_error(self):
+        """Test API error response."""
+        self._respond({"status": "error", "message": "API limit exceeded"})
         
-        self.assertTrue(hasattr(provider, 'get_insider_sentiment'))
-        self.assertTrue(callable(getattr(provider, 'get_insider_sentiment')))
+        result = self.provider._make_request("test_endpoint", {"param": "value"})
         
-        self.assertTrue(hasattr(provider, 'get_insider_transactions'))
-        self.assertTrue(callable(getattr(provider, 'get_insider_transactions')))
+        self.assertIsNone(result)
+
+    def test_make_request_network_error(self):
+        """Test network error handling."""
+        self.mock_get.side_effect = Exception("Network error")
+        
+        result = self.provider._make_request("test_endpoint", {"param": "value"})
+        
+        self.assertIsNone(result)
+
+    def test_make_request_decodes_body_with_orjson(self):
+        """Test that the raw body is decoded directly when orjson is available."""
+        self._respond({"status": "ok", "data": [1]})
+        
+        with patch('tradingagents.dataflows.providers.twelvedata_provider._orjson_loads', json.loads):
+            result = self.provider._make_request("test_endpoint", {"param": "value"})
+        
+        self.assertEqual(result, {"status": "ok", "data": [1]})
+        self.mock_get.return_value.json.assert_not_called()
+
+    def test_session_is_reused(self):
+        """Test that requests share one pooled session across calls and instances."""
+        self._respond({"status": "ok"})
+        session = self.provider.session
+        
+        self.provider._make_request("test_endpoint", {"param": "value"})
+        self.provider._make_request("test_endpoint", {"param": "value"})
+        
+        self.assertEqual(self.mock_get.call_count, 2)
+        self.assertIsInstance(session, requests.Session)
+        self.assertIs(self.provider.session, session)
+        self.assertIs(TwelveDataProvider(self.data_dir).session, session)
+        
+        adapter = session.get_adapter("https://api.twelvedata.com")
+        self.assertGreaterEqual(adapter._pool_connections, 10)
+
+    def test_session_uses_disk_cache_when_available(self):
+        """Test that the shared session is backed by requests_cache when it is installed."""
+        created = {}
+
+        class FakeCachedSession(requests.Session):
+            def __init__(self, cache_name, **kwargs):
+                super().__init__()
+                created.update(kwargs, cache_name=cache_name)
+
+        module = 'tradingagents.dataflows.providers.twelvedata_provider'
+        with patch(f'{module}._CachedSession', FakeCachedSession), patch.dict(f'{module}._sessions', clear=True):
+            with patch(f'{module}.get_config', return_value={"data_cache_dir": "/tmp/cache"}):
+                session = TwelveDataProvider(self.data_dir).session
+        
+        self.assertIsInstance(session, FakeCachedSession)
+        self.assertEqual(created["cache_name"], "/tmp/cache/twelvedata_cache")
+        self.assertEqual(created["backend"], "sqlite")
+        self.assertIn("apikey", created["ignored_parameters"])
+        
+        # Error bodies arrive as HTTP 200 and must not be replayed from the cache
+        is_cacheable = created["filter_fn"]
+        self.assertTrue(is_cacheable(self._respond({"status": "ok", "data": []})))
+        self.assertFalse(is_cacheable(self._respond({"status": "error", "message": "API limit exceeded"})))
+        self.assertFalse(is_cacheable(Mock(status_code=200, content=b'{"code":429,"status":"error"}')))
+        self.assertFalse(is_cacheable(Mock(status_code=500, content=b'{}')))
+        # Large bodies are data, even when an article happens to quote the marker
+        article = {"status": "ok", "data": [{"content": '"status": "error" ' * 100}]}
+        self.assertTrue(is_cacheable(self._respond(article)))
+
+    def test_session_follows_data_cache_dir(self):
+        """Test that moving data_cache_dir with set_config opens the disk cache at the new path."""
+        class FakeCachedSession(requests.Session):
+            def __init__(self, cache_name, **kwargs):
+                super().__init__()
+                self.cache_name = cache_name
+
+        module = 'tradingagents.dataflows.providers.twelvedata_provider'
+        with patch(f'{module}._CachedSession', FakeCachedSession), patch.dict(f'{module}._sessions', clear=True):
+            with patch(f'{module}.get_config', return_value={"data_cache_dir": "/tmp/a"}):
+                first = TwelveDataProvider(self.data_dir).session
+                self.assertIs(TwelveDataProvider(self.data_dir).session, first)
+            with patch(f'{module}.get_config', return_value={"data_cache_dir": "/tmp/b"}):
+                second = TwelveDataProvider(self.data_dir).session
+        
+        self.assertEqual(first.cache_name, "/tmp/a/twelvedata_cache")
+        self.assertEqual(second.cache_name, "/tmp/b/twelvedata_cache")
+
+    def test_make_request_without_api_key(self):
+        """Test API request without API key."""
+        with patch.object(self.provider, 'api_key', ""):
+            result = self.provider._make_request("test_endpoint", {"param": "value"})
+        
+        self.assertIsNone(result)
+
+    def test_get_news_success(self):
+        """Test successful news retrieval."""
+        mock_get = self._replay("news")
+        
+        result = self.provider.get_news("AAPL", "2024-01-01", "2024-01-31")
+        
+        self.assertIn("2024-01-15", result)
+        self.assertEqual(len(result["2024-01-15"]), 1)
+        self.assertEqual(result["2024-01-15"][0]["headline"], "Test News Title")
+        self.assertEqual(mock_get.call_args.args[0], "https://api.twelvedata.com/news")
+        params = mock_get.call_args.kwargs["params"]
+        self.assertEqual(params["start_datetime"], "2024-01-01 00:00:00")
+        self.assertEqual(params["end_datetime"], "2024-01-31 23:59:59")
+
+    def test_get_insider_sentiment_success(self):
+        """Test successful insider sentiment retrieval."""
+        self._replay("recommendations")
+        
+        result = self.provider.get_insider_sentiment("AAPL", "2024-01-01", "2024-01-31")
+        
+        self.assertIn("2024-01-15", result)
+        self.assertIn("mspr", result["2024-01-15"])
+
+    def test_get_company_profile_success(self):
+        """Test successful company profile retrieval."""
+        self._replay("profile")
+        
+        result = self.provider.get_company_profile("AAPL")
+        
+        self.assertEqual(result["name"], "Apple Inc.")
+        self.assertEqual(result["country"], "United States")
+
+
+    def test_get_all_fetches_concurrently(self):
+        """Test that get_all overlaps the news, sentiment and profile requests."""
+        # Each call waits until all three are in flight; serial calls would time out
+        barrier = threading.Barrier(3, timeout=2)
+
+        def waiting(value):
+            def method(*args):
+                barrier.wait()
+                return value
+            return method
+
+        with patch.object(TwelveDataProvider, 'get_news', waiting({"2024-01-15": []})), \
+                patch.object(TwelveDataProvider, 'get_insider_sentiment', waiting({"2024-01-15": {}})), \
+                patch.object(TwelveDataProvider, 'get_company_profile', waiting({"name": "Apple Inc."})):
+            result = self.provider.get_all("AAPL", "2024-01-01", "2024-01-31")
+        
+        self.assertEqual(result, {
+            "news": {"2024-01-15": []},
+            "insider_sentiment": {"2024-01-15": {}},
+            "profile": {"name": "Apple Inc."},
+        })
+
+@pytest.fixture(scope="module")
+def shared_provider():
+    """Build one TwelveDataProvider for the module-level parametrized tests."""
+    with patch('tradingagents.dataflows.providers.twelvedata_provider.get_config') as mock_config:
+        mock_config.return_value = {"twelvedata_api_key": "test_api_key_123"}
+        return TwelveDataProvider(_TwelveDataTestCase.data_dir)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("ticker,start_date,end_date", [
+    ("AAPL", "2024-01-01", "2024-01-07"),
+    ("TSLA", "2023-12-01", "2023-12-31"),
+    ("GOOGL", "2024-06-15", "2024-06-30"),
+    ("MSFT", "2024-02-01", "2024-02-29"),
+])
+def test_methods_accept_parameters(shared_provider, ticker, start_date, end_date):
+    """Test that all methods accept the required parameters without error."""
+    # Empty API responses should come back as empty results rather than raising
+    with patch.object(TwelveDataProvider, '_make_request') as mock_request:
+        mock_request.return_value = None
+        empty = {}
+
+        assert shared_provider.get_news(ticker, start_date, end_date) == empty
+        assert shared_provider.get_insider_sentiment(ticker, start_date, end_date) == empty
+        assert shared_provider.get_insider_transactions(ticker, start_date, end_date) == empty
 
 
 if __name__ == '__main__':
@@ -1,33 +1,234 @@
+import asyncio
+import enum
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import chromadb
 from chromadb.config import Settings
-from openai import OpenAI
+
+
+class BackendKind(enum.IntEnum):
+    """Kind of OpenAI-compatible embeddings backend"""
+
+    OPENAI = 0
+    OLLAMA = 1
+    OTHER = 2
+
+
+# Embedding model used for each backend kind
+_DEFAULT_EMBED_MODELS = {
+    BackendKind.OPENAI: "text-embedding-3-small",
+    BackendKind.OLLAMA: "nomic-embed-text",
+    BackendKind.OTHER: "text-embedding-3-small",
+}
+
+
+def _classify_backend(backend_url):
+    """Classify a backend URL once so later lookups are attribute reads"""
+    if "11434" in backend_url or "ollama" in backend_url:
+        return BackendKind.OLLAMA
+    if "openai.com" in backend_url:
+        return BackendKind.OPENAI
+    return BackendKind.OTHER
+
+
+# Max inputs per embeddings request, keyed by a backend URL substring.
+# Backends listed here accept list input; others get parallel single-text requests.
+_BATCH_SIZES = {
+    "dashscope": 10,
+    "vertex": 250,
+    "openai": 25,
+}
+_DEFAULT_BATCH_SIZE = 10
+
+# Max number of (model, text) embeddings kept per memory; the least recently used go first
+_CACHE_SIZE = 8192
+
+
+def _default_batch_size(backend_url):
+    """Pick the embeddings batch size for a backend URL"""
+    for marker, size in _BATCH_SIZES.items():
+        if marker in backend_url:
+            return size
+    return _DEFAULT_BATCH_SIZE
+
+
+def _supports_batch_input(backend_url):
+    """Check whether a backend is known to accept a list of embedding inputs"""
+    return any(marker in backend_url for marker in _BATCH_SIZES)
+
+
+# OpenAI clients keyed by backend URL, shared by every memory on that backend
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _shared_client(backend_url):
+    """Get the OpenAI client for a backend URL, creating it on first use"""
+    client = _clients.get(backend_url)
+    if client is None:
+        # Parallel embedding workers may race here, so build each client once
+        with _clients_lock:
+            client = _clients.get(backend_url)
+            if client is None:
+                from openai import OpenAI
+
+                client = _clients[backend_url] = OpenAI(base_url=backend_url)
+    return client
+
+
+# AsyncOpenAI clients keyed by backend URL, for the aget_* variants
+_async_clients = {}
+
+
+def _shared_async_client(backend_url):
+    """Get the AsyncOpenAI client for a backend URL, creating it on first use"""
+    client = _async_clients.get(backend_url)
+    if client is None:
+        with _clients_lock:
+            client = _async_clients.get(backend_url)
+            if client is None:
+                from openai import AsyncOpenAI
+
+                client = _async_clients[backend_url] = AsyncOpenAI(base_url=backend_url)
+    return client
 
 
 class FinancialSituationMemory:
     def __init__(self, name, config):
-        if config["backend_url"] == "http://localhost:11434/v1":
-            self.embedding = "nomic-embed-text"
-        else:
-            self.embedding = "text-embedding-3-small"
-        self.client = OpenAI(base_url=config["backend_url"])
+        self.backend_kind = _classify_backend(config["backend_url"])
+        self.embedding = config.get("embedding_model") or _DEFAULT_EMBED_MODELS[self.backend_kind]
+        self.backend_url = config["backend_url"]
+        self.batch_size = int(
+            config.get("embedding_batch_size")
+            or _default_batch_size(config["backend_url"])
+        )
+        self.batch_input = _supports_batch_input(config["backend_url"])
+        self.max_parallel = int(config.get("embedding_max_parallel", 8))
+        self.cache_enabled = config.get("enable_embedding_cache", True)
+        self._cache = OrderedDict()
         self.chroma_client = chromadb.Client(Settings(allow_reset=True))
         self.situation_collection = self.chroma_client.create_collection(name=name)
 
+    @property
+    def client(self):
+        """OpenAI client, created on first use and shared across memories"""
+        return _shared_client(self.backend_url)
+
+    @property
+    def aclient(self):
+        """AsyncOpenAI client, created on first use and shared across memories"""
+        return _shared_async_client(self.backend_url)
+
     def get_embedding(self, text):
         """Get OpenAI embedding for a text"""
-        
-        response = self.client.embeddings.create(
-            model=self.embedding, input=text
-        )
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts):
+        """Get OpenAI embeddings for a list of texts, embedding each distinct text once"""
+        texts = list(texts)
+        found, missing = self._lookup_cached(texts)
+        found.update(zip(missing, self._request_embeddings(missing)))
+        self._store_cached(missing, found)
+        return [found[text] for text in texts]
+
+    async def aget_embedding(self, text):
+        """Async variant of get_embedding"""
+        return (await self.aget_embeddings([text]))[0]
+
+    async def aget_embeddings(self, texts):
+        """Async variant of get_embeddings; requests are multiplexed on the AsyncOpenAI client"""
+        texts = list(texts)
+        found, missing = self._lookup_cached(texts)
+        found.update(zip(missing, await self._arequest_embeddings(missing)))
+        self._store_cached(missing, found)
+        return [found[text] for text in texts]
+
+    def _lookup_cached(self, texts):
+        """Split the distinct texts into cached embeddings and texts still to request"""
+        found = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            key = (self.embedding, text)
+            if self.cache_enabled and key in self._cache:
+                # Refresh the hit so frequently used texts outlive one-off ones
+                self._cache.move_to_end(key)
+                found[text] = self._cache[key]
+            else:
+                missing.append(text)
+        return found, missing
+
+    def _store_cached(self, texts, found):
+        """Cache newly requested embeddings, evicting the least recently used"""
+        if not self.cache_enabled:
+            return
+        for text in texts:
+            self._cache[(self.embedding, text)] = found[text]
+            if len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _batches(self, texts):
+        """Split texts into batch_size chunks"""
+        return [texts[start : start + self.batch_size] for start in range(0, len(texts), self.batch_size)]
+
+    def _request_embeddings(self, texts):
+        """Request embeddings from the API, batch_size texts per request"""
+        if not texts:
+            return []
+        if not self.batch_input:
+            # The endpoint may reject list input, so overlap single-text requests instead
+            with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(texts))) as executor:
+                return list(executor.map(self._request_embedding, texts))
+
+        batches = self._batches(texts)
+        if len(batches) == 1:
+            return self._request_batch(batches[0])
+        # Overlap the round-trips of several batches; map keeps them in input order
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(batches))) as executor:
+            return [embedding for batch in executor.map(self._request_batch, batches) for embedding in batch]
+
+    def _request_batch(self, texts):
+        """Request the embeddings for one batch of texts in a single call"""
+        response = self.client.embeddings.create(model=self.embedding, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    def _request_embedding(self, text):
+        """Request the embedding for a single text"""
+        response = self.client.embeddings.create(model=self.embedding, input=text)
         return response.data[0].embedding
 
+    async def _arequest_embeddings(self, texts):
+        """Async variant of _request_embeddings, with at most max_parallel requests in flight"""
+        if not texts:
+            return []
+        semaphore = asyncio.Semaphore(self.max_parallel)
+
+        async def request(model_input):
+            async with semaphore:
+                return await self.aclient.embeddings.create(model=self.embedding, input=model_input)
+
+        if not self.batch_input:
+            responses = await asyncio.gather(*(request(text) for text in texts))
+            return [response.data[0].embedding for response in responses]
+
+        responses = await asyncio.gather(*(request(batch) for batch in self._batches(texts)))
+        return [
+            item.embedding
+            for response in responses
+            for item in sorted(response.data, key=lambda item: item.index)
+        ]
+
+    def clear_cache(self):
+        """Drop all cached embeddings"""
+        self._cache.clear()
+
     def add_situations(self, situations_and_advice):
         """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
 
         situations = []
         advice = []
         ids = []
-        embeddings = []
 
         offset = self.situation_collection.count()
 
@@ -35,7 +236,8 @@ class FinancialSituationMemory:
             situations.append(situation)
             advice.append(recommendation)
             ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
+
+        embeddings = self.get_embeddings(situations)
 
         self.situation_collection.add(
             documents=situations,
@@ -4,7 +4,7 @@ from .yfin_utils import YFinanceUtils
 from .reddit_utils import fetch_top_from_category
 from .stockstats_utils import StockstatsUtils
 from .yfin_utils import YFinanceUtils
-from .providers import DataProvider, DataProviderFactory, FinnhubProvider, TwelveDataProvider
+from .providers import DataProvider, DataProviderFactory
 
 from .interface import (
     # News and sentiment functions
@@ -50,3 +50,12 @@ __all__ = [
     "FinnhubProvider",
     "TwelveDataProvider",
 ]
+
+
+def __getattr__(name):
+    """Import the built-in provider classes on first access (PEP 562)."""
+    if name in ("FinnhubProvider", "TwelveDataProvider"):
+        from . import providers
+
+        return getattr(providers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
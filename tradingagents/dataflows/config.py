@@ -1,36 +1,57 @@
 import tradingagents.default_config as default_config
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 # Use default config but allow it to be overridden
 _config: Optional[Dict] = None
+# False while _config is still the shared DEFAULT_CONFIG dict
+_owned: bool = False
 DATA_DIR: Optional[str] = None
+# Bumped on every set_config so caches can detect a stale config cheaply
+_config_version: int = 0
 
 
 def initialize_config():
     """Initialize the configuration with default values."""
-    global _config, DATA_DIR
+    global _config, _owned, DATA_DIR
     if _config is None:
-        _config = default_config.DEFAULT_CONFIG.copy()
-        # Add data provider configuration if not present
+        # Share the defaults until the first set_config; copy only if we must add a key
+        _config = default_config.DEFAULT_CONFIG
+        _owned = False
         if "data_provider" not in _config:
+            _config = dict(_config)
+            _owned = True
             _config["data_provider"] = "finnhub"  # Default to Finnhub for backward compatibility
         DATA_DIR = _config["data_dir"]
 
 
 def set_config(config: Dict):
     """Update the configuration with custom values."""
-    global _config, DATA_DIR
+    global _config, _owned, DATA_DIR, _config_version
     if _config is None:
-        _config = default_config.DEFAULT_CONFIG.copy()
+        initialize_config()
+    if not _owned:
+        # Copy-on-write: never mutate DEFAULT_CONFIG itself
+        _config = dict(_config)
+        _owned = True
     _config.update(config)
     DATA_DIR = _config["data_dir"]
+    _config_version += 1
+
 
+def get_config() -> Mapping:
+    """Get a read-only view of the current configuration.
 
-def get_config() -> Dict:
-    """Get the current configuration."""
+    Callers that need a mutable copy should use ``dict(get_config())``.
+    """
     if _config is None:
         initialize_config()
-    return _config.copy()
+    return MappingProxyType(_config)
+
+
+def get_config_version() -> int:
+    """Get the configuration version, incremented by every set_config call."""
+    return _config_version
 
 
 # Initialize with default config
@@ -1,5 +1,71 @@
+import copy
 import json
+import mmap
 import os
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+# Files above this size are streamed with ijson, when installed, instead of parsed whole
+_STREAM_THRESHOLD = 50 * 1024 * 1024
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson parses several times faster when available; json.loads takes bytes too
+try:
+    from orjson import loads as _json_loads
+    _LOADS_BUFFERS = True
+except ImportError:
+    _json_loads = json.loads
+    _LOADS_BUFFERS = False
+
+
+def _load_json(data_path):
+    """
+    Parse a JSON file, mapping it into memory instead of copying it when the parser allows.
+    Args:
+        data_path (str): Path to the JSON file.
+    """
+    with open(data_path, "rb") as f:
+        # json.loads needs bytes or str, and empty files cannot be mapped
+        if not _LOADS_BUFFERS or os.fstat(f.fileno()).st_size == 0:
+            return _json_loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _json_loads(view)
+
+
+@lru_cache(maxsize=64)
+def _data_type_dir(data_dir, data_type):
+    """
+    Join the directory holding one data type, once per data_dir.
+    Args:
+        data_dir (str): Directory where the data is saved.
+        data_type (str): Type of data from finnhub, e.g. news_data.
+    """
+    return os.path.join(data_dir, "finnhub_data", data_type)
+
+
+@lru_cache(maxsize=128)
+def _load_file(data_path, mtime_ns):
+    """
+    Parse a data file once per modification time and share the result.
+    Returns the parsed dict without its empty dates, and its keys in sorted
+    order, for range slicing.
+    Args:
+        data_path (str): Path to the JSON file.
+        mtime_ns (int): File modification time, so rewritten files are parsed again.
+    """
+    data = {key: value for key, value in _load_json(data_path).items() if len(value) > 0}
+    return data, sorted(data)
+
+
+def clear_cache():
+    """
+    Drop every parsed data file.
+    """
+    _load_file.cache_clear()
 
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
@@ -13,24 +79,109 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
     """
 
+    type_dir = _data_type_dir(data_dir, data_type)
     if period:
-        data_path = os.path.join(
-            data_dir,
-            "finnhub_data",
-            data_type,
-            f"{ticker}_{period}_data_formatted.json",
-        )
+        data_path = f"{type_dir}{os.sep}{ticker}_{period}_data_formatted.json"
     else:
-        data_path = os.path.join(
-            data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
-        )
+        shard_dir = f"{type_dir}{os.sep}{ticker}"
+        if os.path.isdir(shard_dir):
+            return _get_sharded_data_in_range(shard_dir, start_date, end_date)
+        data_path = f"{type_dir}{os.sep}{ticker}_data_formatted.json"
 
-    data = open(data_path, "r")
-    data = json.load(data)
+    stat = os.stat(data_path)
+    if ijson is not None and stat.st_size > _STREAM_THRESHOLD:
+        # Keep only the requested dates instead of holding the whole file in memory
+        with open(data_path, "rb") as f:
+            return {
+                key: value
+                for key, value in ijson.kvitems(f, "", use_float=True)
+                if start_date <= key <= end_date and len(value) > 0
+            }
 
-    # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
+    # The parsed file is shared between calls; _filter_range hands out copies of each day
+    data, keys = _load_file(data_path, stat.st_mtime_ns)
     filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
+    _filter_range(data, keys, start_date, end_date, filtered_data)
+    return filtered_data
+
+
+def _filter_range(data, keys, start_date, end_date, filtered_data):
+    """
+    Copy the entries of one parsed file that fall inside the date range.
+    Each day's list is copied, so callers may add, drop or reorder entries
+    freely. The records inside are still shared with the parsed-file cache
+    and must be treated as read-only.
+    Args:
+        data (dict): Parsed file from _load_file, keyed by date.
+        keys (list): Sorted keys of data.
+        start_date (str): Start date in YYYY-MM-DD format.
+        end_date (str): End date in YYYY-MM-DD format.
+        filtered_data (dict): Receives the matching entries.
+    """
+    # slice keys (date, str in format YYYY-MM-DD) to the date range (str, str in format YYYY-MM-DD)
+    lo = bisect_left(keys, start_date)
+    hi = bisect_right(keys, end_date)
+    for key in keys[lo:hi]:
+        filtered_data[key] = copy.copy(data[key])
+
+
+def _months(start_date, end_date):
+    """
+    Yield every YYYY-MM month touched by the date range.
+    Args:
+        start_date (str): Start date in YYYY-MM-DD format.
+        end_date (str): End date in YYYY-MM-DD format.
+    """
+    year, month = int(start_date[:4]), int(start_date[5:7])
+    last = end_date[:7]
+    while True:
+        current = f"{year:04d}-{month:02d}"
+        if current > last:
+            return
+        yield current
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def _get_sharded_data_in_range(shard_dir, start_date, end_date):
+    """
+    Read a date range from per-month shard files written by build_month_shards.
+    Args:
+        shard_dir (str): Directory holding one ticker's YYYY-MM.json shards.
+        start_date (str): Start date in YYYY-MM-DD format.
+        end_date (str): End date in YYYY-MM-DD format.
+    """
+    filtered_data = {}
+    for month in _months(start_date, end_date):
+        shard_path = f"{shard_dir}{os.sep}{month}.json"
+        try:
+            mtime_ns = os.stat(shard_path).st_mtime_ns
+        except FileNotFoundError:
+            # Months without data have no shard
+            continue
+        data, keys = _load_file(shard_path, mtime_ns)
+        _filter_range(data, keys, start_date, end_date, filtered_data)
     return filtered_data
+
+
+def build_month_shards(ticker, data_type, data_dir):
+    """
+    Split a ticker's monolithic data file into per-month shards.
+    Once shards exist, get_data_in_range reads only the months a query touches
+    instead of the whole file. The monolithic file is left in place.
+    Args:
+        ticker (str): Company ticker symbol.
+        data_type (str): Type of data from finnhub, e.g. news_data.
+        data_dir (str): Directory where the data is saved.
+    """
+    type_dir = _data_type_dir(data_dir, data_type)
+    data = _load_json(f"{type_dir}{os.sep}{ticker}_data_formatted.json")
+
+    shards = {}
+    for key, value in data.items():
+        shards.setdefault(key[:7], {})[key] = value
+
+    shard_dir = os.path.join(type_dir, ticker)
+    os.makedirs(shard_dir, exist_ok=True)
+    for month, shard in shards.items():
+        with open(os.path.join(shard_dir, f"{month}.json"), "w") as f:
+            json.dump(shard, f)
@@ -8,12 +8,19 @@ between different financial data providers like Finnhub, 12data, etc.
 # Import only the classes directly, not through dataflows init
 from .factory import DataProviderFactory
 from .base import DataProvider
-from .finnhub_provider import FinnhubProvider
-from .twelvedata_provider import TwelveDataProvider
 
 __all__ = [
     "DataProvider",
     "DataProviderFactory", 
     "FinnhubProvider",
     "TwelveDataProvider",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the built-in provider classes on first access (PEP 562)."""
+    if name == "FinnhubProvider":
+        return DataProviderFactory.providers["finnhub"]
+    if name == "TwelveDataProvider":
+        return DataProviderFactory.providers["twelvedata"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,8 +4,154 @@ Abstract base class for data providers.
 This module defines the interface that all data providers must implement.
 """
 
+import asyncio
+import copy
+import functools
+import inspect
+import json
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, ClassVar, FrozenSet, List, Optional, Tuple, Type, Union
+from ..config import get_config, get_config_version
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Provider methods whose results are cached process-wide
+_CACHED_METHODS = ("get_news", "get_insider_sentiment", "get_insider_transactions")
+
+# Data kind -> provider method, for get_data_range
+DATA_KINDS = MappingProxyType({
+    "news": "get_news",
+    "insider_sentiment": "get_insider_sentiment",
+    "insider_transactions": "get_insider_transactions",
+})
+
+# Provider name -> class, filled in as concrete providers are defined. The
+# factory seeds "module:Class" strings for providers not yet imported.
+_REGISTRY: Dict[str, Union[Type["DataProvider"], str]] = {}
+
+# Max number of responses kept; the least recently used are evicted first
+_RESPONSE_CACHE_SIZE = 1024
+
+# (provider class, data_dir, config version, method, *args) -> (expires_at, result), in LRU order
+_response_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+# Uncached calls currently running, with the thread leading each, so concurrent
+# duplicates share one upstream request. The lock also guards _response_cache.
+_inflight: Dict[Tuple[Any, ...], Tuple[Future, int]] = {}
+_inflight_lock = threading.Lock()
+
+
+def clear_response_cache() -> None:
+    """Drop every cached provider response."""
+    with _inflight_lock:
+        _response_cache.clear()
+
+
+def _lookup(key: Tuple[Any, ...], now: float) -> Optional[Dict[str, Any]]:
+    """Return a live cached response for key, dropping it if expired. Call under _inflight_lock."""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= now:
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return entry[1]
+
+
+def _store(key: Tuple[Any, ...], expires_at: float, result: Dict[str, Any]) -> None:
+    """Cache a response, evicting the least recently used entries. Call under _inflight_lock."""
+    _response_cache[key] = (expires_at, result)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > _RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+def _cached(method):
+    """
+    Wrap a provider method with the process-wide response cache.
+    
+    Subclasses can apply it directly to extra data methods whose arguments
+    are hashable, such as a ticker.
+    
+    Entries live for ``provider_cache_ttl`` seconds from the config; a TTL of
+    0, or a provider with ``CACHE_RESPONSES = False``, disables caching.
+    Ranges that reach today are still filling in, so they are kept for at
+    most ``provider_cache_recent_ttl`` seconds. Keys include the config
+    version, so a set_config that switches API keys or accounts never sees
+    responses fetched under the old settings. Empty
+    results are not cached, since providers also return ``{}`` on errors.
+    Every caller gets its own copy, so mutating a result cannot change what
+    later callers see. Concurrent misses for the same key wait on the first
+    caller's request instead of each going upstream; a thread re-entering
+    its own in-flight call, as an override calling super() does, runs it
+    directly.
+    """
+    signature = inspect.signature(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        ttl = get_config().get("provider_cache_ttl", 0)
+        if not ttl or not self.CACHE_RESPONSES:
+            return method(self, *args, **kwargs)
+        
+        # Key positional and keyword spellings of the same call alike
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (
+            type(self),
+            self.data_dir,
+            get_config_version(),
+            method.__name__,
+            *bound.args[1:],
+            *sorted(bound.kwargs.items()),
+        )
+        end_date = bound.arguments.get("end_date")
+        if isinstance(end_date, str) and end_date >= date.today().isoformat():
+            ttl = min(ttl, get_config().get("provider_cache_recent_ttl", ttl))
+        now = time.monotonic()
+        
+        with _inflight_lock:
+            result = _lookup(key, now)
+            if result is not None:
+                return copy.deepcopy(result)
+            running = _inflight.get(key)
+            if running is None:
+                future = Future()
+                _inflight[key] = (future, threading.get_ident())
+        if running is not None:
+            future, owner = running
+            if owner == threading.get_ident():
+                # An override calling super() re-enters with the same key; waiting on
+                # our own Future would deadlock, so run the parent method directly
+                return method(*bound.args, **bound.kwargs)
+            return copy.deepcopy(future.result())
+        
+        try:
+            result = method(*bound.args, **bound.kwargs)
+            if result:
+                with _inflight_lock:
+                    _store(key, now + ttl, copy.deepcopy(result))
+            future.set_result(copy.deepcopy(result))
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+    
+    return wrapper
 
 
 class DataProvider(ABC):
@@ -16,6 +162,34 @@ class DataProvider(ABC):
     return formats to ensure compatibility across different data sources.
     """
     
+    # Providers are built on every interface call; slots keep instances small
+    __slots__ = ("data_dir",)
+    
+    # Set once per subclass from provider_name, or derived from the class name
+    PROVIDER_NAME: ClassVar[str] = ""
+    
+    # Providers that already cache their own source data can opt out of the response cache
+    CACHE_RESPONSES: ClassVar[bool] = True
+    
+    def __init_subclass__(cls, provider_name: Optional[str] = None, **kwargs):
+        """
+        Register named providers and route their data methods through the response cache.
+        
+        Args:
+            provider_name (Optional[str]): Registry name, e.g.
+                ``class FooProvider(DataProvider, provider_name="foo")``
+        """
+        super().__init_subclass__(**kwargs)
+        if provider_name is not None:
+            cls.PROVIDER_NAME = sys.intern(provider_name.lower().strip())
+            _REGISTRY[cls.PROVIDER_NAME] = cls
+        else:
+            cls.PROVIDER_NAME = cls.__name__.replace("Provider", "").lower()
+        for name in _CACHED_METHODS:
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "__isabstractmethod__", False):
+                setattr(cls, name, _cached(method))
+    
     def __init__(self, data_dir: str):
         """
         Initialize the data provider.
@@ -70,6 +244,192 @@ class DataProvider(ABC):
         """
         pass
     
+    def get_data_range(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        kinds: FrozenSet[str] = frozenset(DATA_KINDS),
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several kinds of data for a company in one call.
+        
+        The default runs the per-kind methods on a small thread pool, so
+        their file reads or HTTP round-trips overlap; providers with a
+        combined endpoint can override this to fetch everything at once.
+        
+        Args:
+            ticker (str): Company ticker symbol (e.g., 'AAPL')
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+            kinds (FrozenSet[str]): Any of "news", "insider_sentiment" and
+                "insider_transactions"
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Data organized by date, keyed by kind
+            
+        Raises:
+            ValueError: If a kind is not recognized
+        """
+        unknown = kinds - DATA_KINDS.keys()
+        if unknown:
+            raise ValueError(f"Unknown data kinds: {', '.join(sorted(unknown))}")
+        
+        if len(kinds) < 2:
+            return {kind: getattr(self, DATA_KINDS[kind])(ticker, start_date, end_date) for kind in kinds}
+        
+        with ThreadPoolExecutor(max_workers=len(kinds)) as executor:
+            futures = {
+                kind: executor.submit(getattr(self, DATA_KINDS[kind]), ticker, start_date, end_date)
+                for kind in kinds
+            }
+            return {kind: future.result() for kind, future in futures.items()}
+    
+    def get_news_frame(self, ticker: str, start_date: str, end_date: str) -> "pd.DataFrame":
+        """
+        Get news data as a DataFrame with one row per article.
+        
+        Args:
+            ticker (str): Company ticker symbol (e.g., 'AAPL')
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+            
+        Returns:
+            pd.DataFrame: Articles with a leading "date" column, in date order
+        """
+        import pandas as pd
+        
+        news = self.get_news(ticker, start_date, end_date)
+        rows = [{"date": date, **item} for date in sorted(news) for item in news[date]]
+        return pd.DataFrame.from_records(rows, columns=None if rows else ["date"])
+    
+    def get_news_batch(self, tickers: List[str], start_date: str, end_date: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get news data for several tickers.
+        
+        The default calls get_news once per ticker; providers with a
+        multi-symbol endpoint or a concurrent client can override this.
+        
+        Args:
+            tickers (List[str]): Company ticker symbols
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: News data organized by date, keyed by ticker
+        """
+        return {ticker: self.get_news(ticker, start_date, end_date) for ticker in tickers}
+    
+    def get_news_json(self, ticker: str, start_date: str, end_date: str) -> bytes:
+        """
+        Get news data as serialized JSON.
+        
+        Providers that receive the payload already in the standard format
+        can override this to return the response body without a decode and
+        re-encode.
+        
+        Args:
+            ticker (str): Company ticker symbol (e.g., 'AAPL')
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+            
+        Returns:
+            bytes: UTF-8 encoded JSON of the get_news result
+        """
+        return json.dumps(self.get_news(ticker, start_date, end_date), separators=(",", ":")).encode()
+    
+    async def aget_news(self, ticker: str, start_date: str, end_date: str) -> Dict[str, Any]:
+        """
+        Async variant of get_news.
+        
+        Runs the blocking implementation in a worker thread; providers with
+        a native async client can override this.
+        
+        Args:
+            ticker (str): Company ticker symbol (e.g., 'AAPL')
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+            
+        Returns:
+            Dict[str, Any]: News data organized by date
+        """
+        return await asyncio.to_thread(self.get_news, ticker, start_date, end_date)
+    
+    async def aget_insider_sentiment(self, ticker: str, start_date: str, end_date: str) -> Dict[str, Any]:
+        """
+        Async variant of get_insider_sentiment.
+        
+        Args:
+            ticker (str): Company ticker symbol (e.g., 'AAPL')
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+            
+        Returns:
+            Dict[str, Any]: Insider sentiment data organized by date
+        """
+        return await asyncio.to_thread(self.get_insider_sentiment, ticker, start_date, end_date)
+    
+    async def aget_insider_transactions(self, ticker: str, start_date: str, end_date: str) -> Dict[str, Any]:
+        """
+        Async variant of get_insider_transactions.
+        
+        Args:
+            ticker (str): Company ticker symbol (e.g., 'AAPL')
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+            
+        Returns:
+            Dict[str, Any]: Insider transaction data organized by date
+        """
+        return await asyncio.to_thread(self.get_insider_transactions, ticker, start_date, end_date)
+    
+    async def aget_news_batch(self, tickers: List[str], start_date: str, end_date: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Async variant of get_news_batch.
+        
+        Fans out one aget_news call per ticker, with at most
+        ``max_concurrency`` requests in flight to respect provider rate limits.
+        
+        Args:
+            tickers (List[str]): Company ticker symbols
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: News data organized by date, keyed by ticker
+        """
+        semaphore = asyncio.Semaphore(get_config().get("max_concurrency", 8))
+        
+        async def fetch(ticker: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aget_news(ticker, start_date, end_date)
+        
+        results = await asyncio.gather(*(fetch(ticker) for ticker in tickers))
+        return dict(zip(tickers, results))
+    
+    async def fetch_all(
+        self, ticker: str, start_date: str, end_date: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Fetch news, insider sentiment and insider transactions concurrently.
+        
+        Args:
+            ticker (str): Company ticker symbol (e.g., 'AAPL')
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+            
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]: News,
+                insider sentiment and insider transaction data
+        """
+        return tuple(
+            await asyncio.gather(
+                self.aget_news(ticker, start_date, end_date),
+                self.aget_insider_sentiment(ticker, start_date, end_date),
+                self.aget_insider_transactions(ticker, start_date, end_date),
+            )
+        )
+    
     def get_provider_name(self) -> str:
         """
         Get the name of this data provider.
@@ -77,4 +437,4 @@ class DataProvider(ABC):
         Returns:
             str: Provider name
         """
-        return self.__class__.__name__.replace("Provider", "").lower()
\ No newline at end of file
+        return self.PROVIDER_NAME
\ No newline at end of file
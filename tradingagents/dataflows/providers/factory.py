@@ -5,10 +5,41 @@ This module provides the factory pattern for creating data provider instances
 based on configuration.
 """
 
-from typing import Optional
-from .base import DataProvider
-from .finnhub_provider import FinnhubProvider
-from .twelvedata_provider import TwelveDataProvider
+import importlib
+import sys
+from collections import ChainMap
+from functools import lru_cache
+from typing import Iterator, Mapping, Optional
+from .base import DataProvider, _REGISTRY
+
+# Provider used when neither the caller nor the config names one
+DEFAULT_PROVIDER = sys.intern("finnhub")
+
+# Built-in providers as "module:Class" specs, imported on first use. Importing
+# a provider module registers the class itself, replacing its spec.
+for _name, _spec in (
+    ("finnhub", ".finnhub_provider:FinnhubProvider"),
+    ("twelvedata", ".twelvedata_provider:TwelveDataProvider"),
+):
+    _REGISTRY.setdefault(sys.intern(_name), _spec)
+
+
+class _ProviderView(Mapping):
+    """Read-only view of the registry that imports lazily registered providers on access."""
+    
+    __slots__ = ()
+    
+    def __getitem__(self, name: str) -> type:
+        provider_class = _REGISTRY[name]
+        if isinstance(provider_class, str):
+            provider_class = DataProviderFactory._resolve(name, provider_class)
+        return provider_class
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_REGISTRY)
+    
+    def __len__(self) -> int:
+        return len(_REGISTRY)
 
 
 class DataProviderFactory:
@@ -19,14 +50,73 @@ class DataProviderFactory:
     based on configuration settings.
     """
     
-    # Registry of available providers
-    _providers = {
-        "finnhub": FinnhubProvider,
-        "twelvedata": TwelveDataProvider,
-    }
+    # Registry of available providers, shared with DataProvider subclasses
+    _providers = _REGISTRY
+    
+    # Read-only view for callers; register_provider is the only way in.
+    # Looking a provider up through it imports the provider if needed.
+    providers: Mapping[str, type] = _ProviderView()
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _normalize(name: str) -> str:
+        """
+        Normalize a provider name to its registry key.
+        
+        Args:
+            name (str): Provider name as supplied by the caller or config
+            
+        Returns:
+            str: Lowercased, whitespace-stripped provider name
+        """
+        return name.lower().strip()
+    
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _build(provider_class: type, data_dir: str, config_version: int) -> DataProvider:
+        """
+        Build a provider instance, reusing it for identical arguments.
+        
+        Args:
+            provider_class (type): Registered provider class
+            data_dir (str): Data directory path
+            config_version (int): Config version, so set_config forces a rebuild
+            
+        Returns:
+            DataProvider: Shared provider instance
+        """
+        return provider_class(data_dir)
+    
+    @classmethod
+    def _resolve(cls, name: str, spec: str) -> type:
+        """
+        Import a lazily registered provider class.
+        
+        Args:
+            name (str): Registry key the spec was found under
+            spec (str): "module:Class" path; the module may be relative to this package
+            
+        Returns:
+            type: The provider class, also stored back in the registry
+        """
+        module_name, _, class_name = spec.partition(":")
+        provider_class = getattr(importlib.import_module(module_name, __package__), class_name)
+        if cls._providers.get(name) == spec:
+            cls._providers[name] = provider_class
+        return provider_class
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached provider instances."""
+        cls._build.cache_clear()
     
     @classmethod
-    def get_provider(cls, provider_name: Optional[str] = None, data_dir: Optional[str] = None) -> DataProvider:
+    def get_provider(
+        cls,
+        provider_name: Optional[str] = None,
+        data_dir: Optional[str] = None,
+        overrides: Optional[Mapping[str, type]] = None,
+    ) -> DataProvider:
         """
         Get a data provider instance.
         
@@ -34,6 +124,8 @@ class DataProviderFactory:
             provider_name (Optional[str]): Name of the provider to create.
                                          If None, uses config or defaults to "finnhub"
             data_dir (Optional[str]): Data directory path. If None, uses config.
+            overrides (Optional[Mapping[str, type]]): Provider classes to consult
+                                         before the registry, without registering them
             
         Returns:
             DataProvider: An instance of the requested data provider
@@ -42,27 +134,30 @@ class DataProviderFactory:
             ValueError: If the provider name is not recognized
         """
         # Import config here to avoid circular imports
-        from ..config import get_config
+        from ..config import get_config, get_config_version
         
         config = get_config()
         
         # Use provided values or fall back to config
         if provider_name is None:
-            provider_name = config.get("data_provider", "finnhub")
+            provider_name = config.get("data_provider", DEFAULT_PROVIDER)
         
         if data_dir is None:
             data_dir = config.get("data_dir", "")
         
-        # Normalize provider name
-        provider_name = provider_name.lower().strip()
-        
-        # Get provider class
-        if provider_name not in cls._providers:
-            available = ", ".join(cls._providers.keys())
+        # Registry keys are already canonical, so only normalize on a miss
+        providers = ChainMap(overrides, cls._providers) if overrides else cls._providers
+        provider_class = providers.get(provider_name)
+        if provider_class is None:
+            provider_name = cls._normalize(provider_name)
+            provider_class = providers.get(provider_name)
+        if provider_class is None:
+            available = ", ".join(providers)
             raise ValueError(f"Unknown data provider '{provider_name}'. Available providers: {available}")
+        if isinstance(provider_class, str):
+            provider_class = cls._resolve(provider_name, provider_class)
         
-        provider_class = cls._providers[provider_name]
-        return provider_class(data_dir)
+        return cls._build(provider_class, data_dir, get_config_version())
     
     @classmethod
     def list_providers(cls) -> list[str]:
@@ -86,4 +181,4 @@ class DataProviderFactory:
         if not issubclass(provider_class, DataProvider):
             raise ValueError("Provider class must inherit from DataProvider")
         
-        cls._providers[name.lower().strip()] = provider_class
\ No newline at end of file
+        cls._providers[sys.intern(cls._normalize(name))] = provider_class
\ No newline at end of file
@@ -4,12 +4,17 @@ Finnhub data provider implementation.
 This module wraps the existing Finnhub functionality in the abstract provider interface.
 """
 
+import logging
+import os
 from typing import Dict, Any
 from .base import DataProvider
+from .. import finnhub_utils
 from ..finnhub_utils import get_data_in_range
 
+logger = logging.getLogger(__name__)
 
-class FinnhubProvider(DataProvider):
+
+class FinnhubProvider(DataProvider, provider_name="finnhub"):
     """
     Finnhub data provider implementation.
     
@@ -17,6 +22,34 @@ class FinnhubProvider(DataProvider):
     abstract provider interface while maintaining backward compatibility.
     """
     
+    __slots__ = ()
+    
+    # finnhub_utils caches parsed files by mtime, so a rewritten file is picked up at once;
+    # the TTL response cache would keep serving the old contents
+    CACHE_RESPONSES = False
+    
+    def __init__(self, data_dir: str):
+        """
+        Initialize the Finnhub provider.
+        
+        A missing ``data_dir/finnhub_data`` is logged as a warning rather
+        than raised: providers are built for directories that are filled in
+        later, and each read still raises FileNotFoundError.
+        
+        Args:
+            data_dir (str): Directory holding the finnhub_data tree
+        """
+        super().__init__(data_dir)
+        
+        # Checked once here; the factory reuses instances, so this is not per request
+        if not os.path.isdir(os.path.join(data_dir, "finnhub_data")):
+            logger.warning("Finnhub data not found under %r. Set data_dir in the config.", data_dir)
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop the parsed data files shared by all Finnhub providers."""
+        finnhub_utils.clear_cache()
+    
     def get_news(self, ticker: str, start_date: str, end_date: str) -> Dict[str, Any]:
         """
         Get news data from Finnhub for a company within a date range.
@@ -57,4 +90,4 @@ class FinnhubProvider(DataProvider):
         Returns:
             Dict[str, Any]: Insider transaction data organized by date
         """
-        return get_data_in_range(ticker, start_date, end_date, "insider_trans", self.data_dir)
\ No newline at end of file
+        return get_data_in_range(ticker, start_date, end_date, "insider_trans", self.data_dir)
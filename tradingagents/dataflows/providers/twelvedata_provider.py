@@ -5,18 +5,260 @@ This module provides integration with the TwelveData API for financial data.
 Includes rate limiting, error handling, and data transformation.
 """
 
+import asyncio
+import os
+import re
 import time
 import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import requests
-from .base import DataProvider
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .base import DataProvider, _cached
 from ..config import get_config
 
 logger = logging.getLogger(__name__)
 
+# orjson decodes large news payloads several times faster than response.json()
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
 
-class TwelveDataProvider(DataProvider):
+# requests_cache persists responses in SQLite, so reruns over historical ranges skip the network
+try:
+    from requests_cache import CachedSession as _CachedSession
+except ImportError:
+    _CachedSession = None
+
+# Connection pool size for the shared TwelveData session
+_POOL_SIZE = 10
+
+# Transient statuses retried with exponential backoff (429 honours Retry-After)
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+)
+
+# Worker threads used when fetching news for several tickers at once
+_BATCH_WORKERS = 8
+
+# TwelveData quota: 600 calls per minute, with up to this many sent back to back
+_RATE_PER_SECOND = 600 / 60.0
+_BURST = 10
+
+# Strict YYYY-MM-DD; date.fromisoformat also takes "20240101" and week dates on 3.11+
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+# Seconds each endpoint's responses stay valid in the on-disk cache
+_DISK_CACHE_EXPIRY = {
+    "api.twelvedata.com/news": 3600,
+    "api.twelvedata.com/recommendations": 3600,
+    "api.twelvedata.com/profile": 86400,
+}
+
+# TwelveData error bodies are small JSON objects; larger bodies are never errors
+_ERROR_BODY_MAX = 1024
+_ERROR_STATUS_RE = re.compile(rb'"status"\s*:\s*"error"')
+
+# Shared sessions keyed by the data_cache_dir their disk cache lives under (None without requests_cache)
+_sessions: Dict[Optional[str], requests.Session] = {}
+_session_lock = threading.Lock()
+
+
+def _parse_date(value: str) -> date:
+    """
+    Parse a strict YYYY-MM-DD date string.
+    
+    Args:
+        value (str): Date string
+        
+    Returns:
+        date: The parsed date
+        
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date
+    """
+    match = _DATE_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid date {value!r}; expected YYYY-MM-DD")
+    return date(int(match[1]), int(match[2]), int(match[3]))
+
+
+def _is_cacheable(response: requests.Response) -> bool:
+    """
+    Decide whether requests_cache may store a response.
+    
+    TwelveData reports errors, quota exhaustion included, as HTTP 200 with
+    ``"status": "error"``; storing those would replay the error for hours.
+    The body is scanned for that marker rather than decoded, so caching
+    does not parse every payload a second time.
+    
+    Args:
+        response (requests.Response): Response about to be cached
+        
+    Returns:
+        bool: True for successful responses that are not error bodies
+    """
+    if response.status_code != 200:
+        return False
+    body = response.content
+    return len(body) > _ERROR_BODY_MAX or _ERROR_STATUS_RE.search(body) is None
+
+
+def _get_session() -> requests.Session:
+    """
+    Get the process-wide TwelveData HTTP session.
+    
+    The factory builds a new provider for every interface call, so sharing
+    one pooled session keeps TLS connections alive across those instances.
+    
+    When requests_cache is installed the session also keeps GET responses
+    in an SQLite file under ``data_cache_dir``, which outlives the process.
+    A set_config that moves ``data_cache_dir`` gets a session on the new
+    file; the per-endpoint expiry is fixed by _DISK_CACHE_EXPIRY.
+    
+    Returns:
+        requests.Session: Shared session with a pooled, retrying HTTPS adapter
+    """
+    cache_dir = get_config()["data_cache_dir"] if _CachedSession is not None else None
+    session = _sessions.get(cache_dir)
+    if session is None:
+        # Providers may be built from several threads; only one should create the session
+        with _session_lock:
+            session = _sessions.get(cache_dir)
+            if session is None:
+                if cache_dir is not None:
+                    session = _CachedSession(
+                        os.path.join(cache_dir, "twelvedata_cache"),
+                        backend="sqlite",
+                        urls_expire_after=_DISK_CACHE_EXPIRY,
+                        allowable_methods=("GET",),
+                        # Keep the key out of the cache file and out of the cache key
+                        ignored_parameters=("apikey",),
+                        filter_fn=_is_cacheable,
+                    )
+                else:
+                    session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=_RETRY),
+                )
+                session.headers["User-Agent"] = "tradingagents/0.1.0"
+                _sessions[cache_dir] = session
+    return session
+
+
+def _is_iso_date(value: str) -> bool:
+    """
+    Check that a string has the YYYY-MM-DD shape, so it can be range-checked lexically.
+    
+    Args:
+        value (str): Candidate date string
+        
+    Returns:
+        bool: True if the string looks like an ISO date
+    """
+    return len(value) == 10 and value[4] == "-" and value[7] == "-"
+
+
+@lru_cache(maxsize=64)
+def _rating_score(rating: str) -> int:
+    """
+    Map an analyst rating to a sentiment score, once per distinct rating.
+    
+    Args:
+        rating (str): Rating as returned by TwelveData (e.g. 'Strong Buy')
+        
+    Returns:
+        int: 1 for buy/positive ratings, -1 for sell/negative ratings, else 0
+    """
+    rating = rating.lower()
+    if "buy" in rating or "positive" in rating:
+        return 1
+    if "sell" in rating or "negative" in rating:
+        return -1
+    return 0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Tokens refill continuously at ``rate`` per second up to ``capacity``, so
+    bursts of up to ``capacity`` calls go out immediately and callers only
+    wait once the bucket is empty.
+    """
+    
+    __slots__ = ("rate", "capacity", "tokens", "last", "_lock")
+    
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            rate (float): Tokens added per second
+            capacity (int): Maximum number of stored tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, cost: float = 1) -> None:
+        """
+        Take ``cost`` tokens, sleeping until enough have refilled.
+        
+        The wait is worked out under the lock but slept after releasing it,
+        so one throttled caller never blocks the others' bookkeeping.
+        
+        Args:
+            cost (float): Tokens to consume
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # Reserve the tokens now; a negative balance queues later callers behind us
+            self.tokens -= cost
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        
+        # Sleep outside the lock so other callers can reserve their own slots meanwhile
+        if wait:
+            time.sleep(wait)
+
+
+# One bucket per API key, since the quota is per key rather than per provider instance
+_rate_limiters: Dict[str, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def _get_rate_limiter(api_key: str) -> TokenBucket:
+    """
+    Get the process-wide rate limiter for an API key.
+    
+    Args:
+        api_key (str): TwelveData API key
+        
+    Returns:
+        TokenBucket: Bucket shared by every provider using this key
+    """
+    with _rate_limiters_lock:
+        bucket = _rate_limiters.get(api_key)
+        if bucket is None:
+            bucket = _rate_limiters[api_key] = TokenBucket(_RATE_PER_SECOND, _BURST)
+        return bucket
+
+
+class TwelveDataProvider(DataProvider, provider_name="twelvedata"):
     """
     TwelveData provider implementation.
     
@@ -24,6 +266,13 @@ class TwelveDataProvider(DataProvider):
     including news, insider sentiment, and insider transactions.
     """
     
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "session",
+        "rate_limiter",
+    )
+    
     def __init__(self, data_dir: str):
         """
         Initialize the TwelveData provider.
@@ -35,23 +284,16 @@ class TwelveDataProvider(DataProvider):
         config = get_config()
         self.api_key = config.get("twelvedata_api_key", "")
         self.base_url = "https://api.twelvedata.com"
-        self.session = requests.Session()
-        self.last_request_time = 0
-        self.rate_limit_delay = 60.0 / 600  # 600 calls per minute (0.1 seconds delay)
+        self.session = _get_session()
+        self.rate_limiter = _get_rate_limiter(self.api_key)
         
         if not self.api_key:
             logger.warning("TwelveData API key not configured. Set TWELVEDATA_API_KEY environment variable.")
     
     def _rate_limit(self):
         """Implement rate limiting between API calls."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last_request
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        # Batched fetches call this from worker threads; the bucket serializes them
+        self.rate_limiter.acquire()
     
     def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -77,7 +319,7 @@ class TwelveDataProvider(DataProvider):
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = _orjson_loads(response.content) if _orjson_loads is not None else response.json()
             
             # Check for API error responses
             if isinstance(data, dict) and "status" in data and data["status"] == "error":
@@ -102,12 +344,10 @@ class TwelveDataProvider(DataProvider):
             end_date (str): End date in YYYY-MM-DD format
             
         Returns:
-            tuple: (start_datetime, end_datetime)
+            tuple: (start_date, end_date) as datetime.date objects
         """
         try:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-            return start_dt, end_dt
+            return _parse_date(start_date), _parse_date(end_date)
         except ValueError as e:
             logger.error(f"Invalid date format: {e}")
             raise
@@ -125,11 +365,14 @@ class TwelveDataProvider(DataProvider):
             Dict[str, Any]: News data organized by date
         """
         try:
-            start_dt, end_dt = self._parse_date_range(start_date, end_date)
+            # Bad dates are logged and read as an empty result, before any request is made
+            self._parse_date_range(start_date, end_date)
             
-            # TwelveData news endpoint parameters
+            # TwelveData news endpoint parameters; the server filters to the date range
             params = {
                 "symbol": ticker,
+                "start_datetime": f"{start_date} 00:00:00",
+                "end_datetime": f"{end_date} 23:59:59",
                 "outputsize": 1000,  # Maximum number of articles
             }
             
@@ -139,41 +382,58 @@ class TwelveDataProvider(DataProvider):
                 return {}
             
             # Transform TwelveData news format to match expected format
-            news_by_date = {}
+            news_by_date = defaultdict(list)
             
             for article in data["data"]:
-                # Parse article date
                 article_date = article.get("datetime", "")
-                if article_date:
+                if not article_date:
+                    continue
+                
+                # TwelveData provides ISO datetimes, whose first ten characters are the date
+                article_date_str = article_date[:10]
+                if not _is_iso_date(article_date_str):
                     try:
-                        # TwelveData provides datetime in ISO format
                         article_dt = datetime.fromisoformat(article_date.replace("Z", "+00:00"))
-                        article_date_str = article_dt.strftime("%Y-%m-%d")
-                        
-                        # Filter by date range
-                        if start_dt <= article_dt.date() <= end_dt.date():
-                            if article_date_str not in news_by_date:
-                                news_by_date[article_date_str] = []
-                            
-                            # Transform article format
-                            transformed_article = {
-                                "headline": article.get("title", ""),
-                                "summary": article.get("content", "")[:500],  # Truncate for consistency
-                                "source": article.get("source", "TwelveData"),
-                                "url": article.get("url", ""),
-                                "datetime": article_date,
-                            }
-                            news_by_date[article_date_str].append(transformed_article)
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Error parsing article date {article_date}: {e}")
+                    except ValueError as e:
+                        logger.warning("Error parsing article date %s: %s", article_date, e)
                         continue
+                    article_date_str = article_dt.strftime("%Y-%m-%d")
+                
+                # Defensive check in case the server ignores the range; ISO dates compare lexically
+                if start_date <= article_date_str <= end_date:
+                    news_by_date[article_date_str].append({
+                        "headline": article.get("title", ""),
+                        "summary": article.get("content", "")[:500],  # Truncate for consistency
+                        "source": article.get("source", "TwelveData"),
+                        "url": article.get("url", ""),
+                        "datetime": article_date,
+                    })
             
-            return news_by_date
+            return dict(news_by_date)
             
         except Exception as e:
             logger.error(f"Error fetching news from TwelveData: {e}")
             return {}
     
+    def get_news_batch(self, tickers: List[str], start_date: str, end_date: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get news data for several tickers concurrently.
+        
+        Args:
+            tickers (List[str]): Company ticker symbols
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: News data organized by date, keyed by ticker
+        """
+        if not tickers:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(_BATCH_WORKERS, len(tickers))) as executor:
+            results = executor.map(lambda ticker: self.get_news(ticker, start_date, end_date), tickers)
+            return dict(zip(tickers, results))
+    
     def get_insider_sentiment(self, ticker: str, start_date: str, end_date: str) -> Dict[str, Any]:
         """
         Get insider sentiment data from TwelveData for a company within a date range.
@@ -190,6 +450,8 @@ class TwelveDataProvider(DataProvider):
             Dict[str, Any]: Insider sentiment data organized by date
         """
         try:
+            self._parse_date_range(start_date, end_date)
+            
             # Use analyst recommendations as proxy for insider sentiment
             params = {
                 "symbol": ticker,
@@ -201,35 +463,22 @@ class TwelveDataProvider(DataProvider):
                 return {}
             
             # Transform recommendations to sentiment-like format
-            sentiment_by_date = {}
-            start_dt, end_dt = self._parse_date_range(start_date, end_date)
+            sentiment_by_date = defaultdict(lambda: {"change": 0, "mspr": 0})  # Mock sentiment score
             
             for recommendation in data["data"]:
                 rec_date = recommendation.get("date", "")
-                if rec_date:
-                    try:
-                        rec_dt = datetime.strptime(rec_date, "%Y-%m-%d")
-                        
-                        # Filter by date range
-                        if start_dt <= rec_dt <= end_dt:
-                            if rec_date not in sentiment_by_date:
-                                sentiment_by_date[rec_date] = {
-                                    "change": 0,
-                                    "mspr": 0,  # Mock sentiment score
-                                }
-                            
-                            # Convert recommendation to sentiment score
-                            rating = recommendation.get("rating", "").lower()
-                            if "buy" in rating or "positive" in rating:
-                                sentiment_by_date[rec_date]["mspr"] += 1
-                            elif "sell" in rating or "negative" in rating:
-                                sentiment_by_date[rec_date]["mspr"] -= 1
-                                
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Error parsing recommendation date {rec_date}: {e}")
-                        continue
+                if not rec_date:
+                    continue
+                if not _is_iso_date(rec_date):
+                    logger.warning("Error parsing recommendation date %s", rec_date)
+                    continue
+                
+                # Filter by date range; ISO dates compare lexically
+                if start_date <= rec_date <= end_date:
+                    # Convert recommendation to sentiment score
+                    sentiment_by_date[rec_date]["mspr"] += _rating_score(recommendation.get("rating", ""))
             
-            return sentiment_by_date
+            return dict(sentiment_by_date)
             
         except Exception as e:
             logger.error(f"Error fetching insider sentiment from TwelveData: {e}")
@@ -254,13 +503,14 @@ class TwelveDataProvider(DataProvider):
         try:
             # TwelveData doesn't provide insider transactions
             # This could be extended to use other data sources or APIs
-            logger.info(f"Insider transactions not available from TwelveData for {ticker}")
+            logger.debug("Insider transactions not available from TwelveData for %s", ticker)
             return {}
             
         except Exception as e:
             logger.error(f"Error fetching insider transactions from TwelveData: {e}")
             return {}
     
+    @_cached
     def get_company_profile(self, ticker: str) -> Dict[str, Any]:
         """
         Get company profile data from TwelveData.
@@ -285,4 +535,41 @@ class TwelveDataProvider(DataProvider):
             
         except Exception as e:
             logger.error(f"Error fetching company profile from TwelveData: {e}")
-            return {}
\ No newline at end of file
+            return {}
+    
+    def get_all(self, ticker: str, start_date: str, end_date: str) -> Dict[str, Any]:
+        """
+        Get news, insider sentiment and the company profile concurrently.
+        
+        Insider transactions are left out since TwelveData has no endpoint
+        for them.
+        
+        Args:
+            ticker (str): Company ticker symbol (e.g., 'AAPL')
+            start_date (str): Start date in YYYY-MM-DD format
+            end_date (str): End date in YYYY-MM-DD format
+            
+        Returns:
+            Dict[str, Any]: Results keyed by "news", "insider_sentiment" and "profile"
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            news = executor.submit(self.get_news, ticker, start_date, end_date)
+            sentiment = executor.submit(self.get_insider_sentiment, ticker, start_date, end_date)
+            profile = executor.submit(self.get_company_profile, ticker)
+            return {
+                "news": news.result(),
+                "insider_sentiment": sentiment.result(),
+                "profile": profile.result(),
+            }
+    
+    async def aget_company_profile(self, ticker: str) -> Dict[str, Any]:
+        """
+        Async variant of get_company_profile.
+        
+        Args:
+            ticker (str): Company ticker symbol (e.g., 'AAPL')
+            
+        Returns:
+            Dict[str, Any]: Company profile data
+        """
+        return await asyncio.to_thread(self.get_company_profile, ticker)
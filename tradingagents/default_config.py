@@ -13,6 +13,10 @@ DEFAULT_CONFIG = {
     "deep_think_llm": "o4-mini",
     "quick_think_llm": "gpt-4o-mini",
     "backend_url": "https://api.openai.com/v1",
+    "embedding_model": None,  # None picks a per-backend default
+    "embedding_batch_size": None,  # None picks a per-backend default
+    "embedding_max_parallel": 8,  # Concurrent embeddings requests in flight
+    "enable_embedding_cache": True,
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
@@ -22,4 +26,7 @@ DEFAULT_CONFIG = {
     # Data provider settings
     "data_provider": "finnhub",
     "twelvedata_api_key": os.getenv("TWELVEDATA_API_KEY", ""),
+    "provider_cache_ttl": 86400,  # Seconds to reuse provider responses; 0 disables
+    "provider_cache_recent_ttl": 300,  # Cap for ranges that reach today, whose data is still arriving
+    "max_concurrency": 8,  # In-flight provider requests for async batch fetches
 }
@@ -0,0 +1,65 @@
+# TradingAgents/graph/llm_clients.py
+
+import atexit
+import threading
+from typing import Dict, Any, Tuple
+
+
+# LLM clients shared across graphs, keyed by (provider, model, backend_url)
+_llm_cache: Dict[Tuple[str, str, str], Any] = {}
+_llm_lock = threading.Lock()
+
+# Pooled HTTP client shared by every OpenAI-compatible chat model
+_http_client = None
+
+
+def _get_http_client():
+    """Get the shared httpx client, creating it on first use. Call under _llm_lock."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+
+        _http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=60.0,
+        )
+        atexit.register(_http_client.close)
+    return _http_client
+
+
+def _get_llm(provider: str, model: str, backend_url: str):
+    """Get the chat model client for a provider/model pair, building it on first use."""
+    key = (provider.lower(), model, backend_url)
+    llm = _llm_cache.get(key)
+    if llm is None:
+        # Graphs may be built from several threads; build each client (and its pool) once
+        with _llm_lock:
+            llm = _llm_cache.get(key)
+            if llm is None:
+                llm = _llm_cache[key] = _build_llm(key[0], model, backend_url)
+    return llm
+
+
+def _build_llm(provider: str, model: str, backend_url: str):
+    """Construct a chat model client for a lowercased provider name. Call under _llm_lock."""
+    # Import only the SDK for the configured provider
+    if provider in ("openai", "ollama", "openrouter"):
+        from langchain_openai import ChatOpenAI
+
+        # Deep and quick models share one connection pool instead of one each
+        return ChatOpenAI(model=model, base_url=backend_url, http_client=_get_http_client())
+    if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(model=model, base_url=backend_url)
+    if provider == "google":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(model=model)
+    raise ValueError(f"Unsupported LLM provider: {provider}")
+
+
+def clear_llm_cache():
+    """Drop all cached LLM clients."""
+    with _llm_lock:
+        _llm_cache.clear()
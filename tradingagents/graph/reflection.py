@@ -1,13 +1,15 @@
 # TradingAgents/graph/reflection.py
 
-from typing import Dict, Any
-from langchain_openai import ChatOpenAI
+from typing import TYPE_CHECKING, Dict, Any, List, Tuple
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 
 class Reflector:
     """Handles reflection on decisions and updating memory."""
 
-    def __init__(self, quick_thinking_llm: ChatOpenAI):
+    def __init__(self, quick_thinking_llm: "ChatOpenAI"):
         """Initialize the reflector with an LLM."""
         self.quick_thinking_llm = quick_thinking_llm
         self.reflection_system_prompt = self._get_reflection_prompt()
@@ -55,11 +57,9 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
 
         return f"{curr_market_report}\n\n{curr_sentiment_report}\n\n{curr_news_report}\n\n{curr_fundamentals_report}"
 
-    def _reflect_on_component(
-        self, component_type: str, report: str, situation: str, returns_losses
-    ) -> str:
-        """Generate reflection for a component."""
-        messages = [
+    def _reflection_messages(self, report: str, situation: str, returns_losses) -> List[Tuple[str, str]]:
+        """Build the reflection prompt for one component's report."""
+        return [
             ("system", self.reflection_system_prompt),
             (
                 "human",
@@ -67,9 +67,46 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
             ),
         ]
 
+    def _reflect_on_component(
+        self, component_type: str, report: str, situation: str, returns_losses
+    ) -> str:
+        """Generate reflection for a component."""
+        messages = self._reflection_messages(report, situation, returns_losses)
+
         result = self.quick_thinking_llm.invoke(messages).content
         return result
 
+    def reflect_all(
+        self,
+        current_state,
+        returns_losses,
+        bull_memory,
+        bear_memory,
+        trader_memory,
+        invest_judge_memory,
+        risk_manager_memory,
+    ):
+        """Reflect on every component in one batched LLM call and update each memory."""
+        situation = self._extract_current_situation(current_state)
+        reports_and_memories = [
+            (current_state["investment_debate_state"]["bull_history"], bull_memory),
+            (current_state["investment_debate_state"]["bear_history"], bear_memory),
+            (current_state["trader_investment_plan"], trader_memory),
+            (current_state["investment_debate_state"]["judge_decision"], invest_judge_memory),
+            (current_state["risk_debate_state"]["judge_decision"], risk_manager_memory),
+        ]
+
+        # The five reflections are independent, so let the LLM client run them concurrently
+        results = self.quick_thinking_llm.batch(
+            [
+                self._reflection_messages(report, situation, returns_losses)
+                for report, _ in reports_and_memories
+            ]
+        )
+
+        for (_, memory), result in zip(reports_and_memories, results):
+            memory.add_situations([(situation, result.content)])
+
     def reflect_bull_researcher(self, current_state, returns_losses, bull_memory):
         """Reflect on bull researcher's analysis and update memory."""
         situation = self._extract_current_situation(current_state)